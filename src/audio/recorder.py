@@ -29,6 +29,10 @@ class AudioRecorder:
 
     def __init__(self, config: AudioConfig) -> None:
         self._config = config
+        # Переиспользуемый буфер записи: выделяется один раз на процесс
+        # под max_duration и заполняется колбэком по месту — без копии
+        # каждого блока и без np.concatenate на остановке
+        self._buffer: Optional[np.ndarray] = None
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._cancel_event = threading.Event()
@@ -60,13 +64,26 @@ class AudioRecorder:
         channels = self._config.channels
         max_duration = self._config.max_duration
 
-        frames: list[np.ndarray] = []
+        # Запас в одну секунду на хвостовой блок, пришедший после дедлайна
+        max_samples = int(max_duration * sample_rate) + sample_rate
+        buffer = self._buffer
+        if buffer is None or buffer.shape != (max_samples, channels):
+            buffer = np.empty((max_samples, channels), dtype="float32")
+            self._buffer = buffer
+
+        pos = 0
         start_time = time.time()
 
         def callback(indata, frames_count, time_info, status):  # type: ignore[no-untyped-def]
+            nonlocal pos
             if self._stop_event.is_set() or self._cancel_event.is_set():
                 raise sd.CallbackStop()
-            frames.append(indata.copy())
+            end = min(pos + indata.shape[0], max_samples)
+            buffer[pos:end] = indata[: end - pos]
+            pos = end
+            if pos >= max_samples:
+                self._stop_event.set()
+                raise sd.CallbackStop()
 
         try:
             device = self._config.device
@@ -80,11 +97,14 @@ class AudioRecorder:
                 callback=callback,
                 device=device,
             ):
+                # Спим на событии до stop()/cancel() или конца max_duration:
+                # поток не просыпается 20 раз в секунду ради проверки флага
                 while not self._stop_event.is_set():
-                    if time.time() - start_time >= max_duration:
+                    remaining = max_duration - (time.time() - start_time)
+                    if remaining <= 0:
                         self._stop_event.set()
                         break
-                    time.sleep(0.05)
+                    self._stop_event.wait(timeout=remaining)
         except sd.PortAudioError:
             # In MVP we silently ignore and do nothing; later we can log and notify UI
             pass
@@ -92,10 +112,13 @@ class AudioRecorder:
         if self._cancel_event.is_set():
             return
 
-        if not frames:
+        # Отдаём копию ровно записанной длины: обработка асинхронна, а
+        # буфер будет перезаписан следующей записью. Одна аллокация
+        # вместо копии каждого блока плюс concatenate.
+        if pos == 0:
             data = np.array([], dtype="float32")
         else:
-            data = np.concatenate(frames, axis=0)
+            data = buffer[:pos].copy()
 
         audio = AudioData(samples=data, sample_rate=sample_rate, channels=channels)
 
@@ -63,6 +63,14 @@ class GroqRecognitionConfig:
 @dataclass
 class RecognitionConfig:
     backend: str = "groq"  # openai, groq
+    # Прогрев при старте: создать fallback-распознаватель и открыть
+    # TLS-соединения к API заранее, чтобы первая запись не платила
+    # за handshake.
+    prewarm: bool = True
+    # Хеджирование: первая попытка уходит на оба backend'а сразу,
+    # берётся первый успешный ответ. Латентность падает до минимума
+    # из двух, но каждый запрос оплачивается дважды — поэтому выключено.
+    hedge: bool = False
     openai: OpenAIRecognitionConfig = field(default_factory=OpenAIRecognitionConfig)
     groq: GroqRecognitionConfig = field(default_factory=GroqRecognitionConfig)
 
@@ -84,6 +92,16 @@ class PostprocessConfig:
     enabled: bool = True
     mode: str = "llm"  # simple, llm
     llm_backend: str = "groq"  # groq, openai
+    # Ранняя вставка: regex-вариант уходит в буфер обмена сразу,
+    # LLM-вариант подменяет его, когда модель ответит.
+    # По умолчанию выключено — один финальный текст без замены.
+    eager_paste: bool = False
+    # Порог «тривиального» результата: короче min_chars_for_llm символов
+    # или короче min_duration_sec секунд записи — LLM не вызывается,
+    # остаётся regex-вариант (экономит целый сетевой round-trip на
+    # случайных нажатиях и шумовых записях).
+    min_chars_for_llm: int = 8
+    min_duration_sec: float = 0.4
     prompt: str = (
         "Ты помощник по русскому языку. "
         "Исправь опечатки, добавь пунктуацию, сделай текст грамматически верным. "
@@ -162,6 +180,8 @@ class AppSettings:
                 "audio": AudioConfig().__dict__,
                 "recognition": {
                     "backend": RecognitionConfig().backend,
+                    "prewarm": RecognitionConfig().prewarm,
+                    "hedge": RecognitionConfig().hedge,
                     "openai": OpenAIRecognitionConfig().__dict__,
                     "groq": GroqRecognitionConfig().__dict__,
                 },
@@ -169,6 +189,9 @@ class AppSettings:
                     "enabled": PostprocessConfig().enabled,
                     "mode": PostprocessConfig().mode,
                     "llm_backend": PostprocessConfig().llm_backend,
+                    "eager_paste": PostprocessConfig().eager_paste,
+                    "min_chars_for_llm": PostprocessConfig().min_chars_for_llm,
+                    "min_duration_sec": PostprocessConfig().min_duration_sec,
                     "groq": {"model": GroqPostprocessConfig().model},
                     "openai": {
                         "model": OpenAIPostprocessConfig().model,
@@ -215,6 +238,8 @@ class AppSettings:
 
         recognition_cfg = RecognitionConfig(
             backend=rec_raw.get("backend", "groq"),
+            prewarm=rec_raw.get("prewarm", True),
+            hedge=rec_raw.get("hedge", False),
             openai=OpenAIRecognitionConfig(
                 **{**OpenAIRecognitionConfig().__dict__, **openai_raw_rec}
             ),
@@ -239,6 +264,9 @@ class AppSettings:
             enabled=post_raw.get("enabled", True),
             mode=post_raw.get("mode", "llm"),
             llm_backend=post_raw.get("llm_backend", "groq"),
+            eager_paste=post_raw.get("eager_paste", False),
+            min_chars_for_llm=post_raw.get("min_chars_for_llm", 8),
+            min_duration_sec=post_raw.get("min_duration_sec", 0.4),
             prompt=post_raw.get("prompt", PostprocessConfig.prompt),
             groq=GroqPostprocessConfig(
                 **{**GroqPostprocessConfig().__dict__, **groq_post_raw}
@@ -302,6 +330,8 @@ class AppSettings:
             "audio": settings.audio.__dict__,
             "recognition": {
                 "backend": settings.recognition.backend,
+                "prewarm": settings.recognition.prewarm,
+                "hedge": settings.recognition.hedge,
                 "openai": settings.recognition.openai.__dict__,
                 "groq": settings.recognition.groq.__dict__,
             },
@@ -309,6 +339,9 @@ class AppSettings:
                 "enabled": settings.postprocess.enabled,
                 "mode": settings.postprocess.mode,
                 "llm_backend": settings.postprocess.llm_backend,
+                "eager_paste": settings.postprocess.eager_paste,
+                "min_chars_for_llm": settings.postprocess.min_chars_for_llm,
+                "min_duration_sec": settings.postprocess.min_duration_sec,
                 "prompt": settings.postprocess.prompt,
                 "groq": {"model": settings.postprocess.groq.model},
                 "openai": {
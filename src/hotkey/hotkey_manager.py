@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import queue
+import time
 from dataclasses import dataclass
-from threading import Thread
-from typing import Callable, Optional
+from functools import partial
+from threading import Event, Thread
+from typing import Callable, FrozenSet, Optional
 
 import keyboard  # type: ignore[import]
 
@@ -55,6 +58,19 @@ class HotKeyManager:
         self.toggle_window_hotkey = toggle_window_hotkey
         self.toggle_debug_hotkey = toggle_debug_hotkey
 
+        # Комбинации разбираем здесь только как fail-fast валидацию:
+        # кривые значения из config.yaml всплывают при конструировании,
+        # а не при start(). В add_hotkey уходят ИСХОДНЫЕ строки — если
+        # отдать ему результат parse_hotkey, он перепарсит кортеж и
+        # схлопнет многоклавишную комбинацию в одну псевдоклавишу,
+        # срабатывающую от любого её скан-кода (Ctrl в одиночку запускал
+        # бы запись для "ctrl+win").
+        keyboard.parse_hotkey(record_hotkey)
+        keyboard.parse_hotkey(record_idea_hotkey)
+        keyboard.parse_hotkey(cancel_hotkey)
+        keyboard.parse_hotkey(toggle_window_hotkey)
+        keyboard.parse_hotkey(toggle_debug_hotkey)
+
         self.callbacks = HotkeyCallbacks(
             on_record_press=on_record_press,
             on_record_release=on_record_release,
@@ -68,6 +84,22 @@ class HotKeyManager:
 
         self._listener_thread: Optional[Thread] = None
         self._running: bool = False
+        self._stop_event = Event()
+
+        # Колбэки не выполняются на hook-потоке библиотеки keyboard:
+        # хуки лишь кладут их в очередь, а выполняет отдельный worker.
+        # Долгий колбэк (старт записи, работа с UI) не задерживает
+        # обработку следующих клавиатурных событий системы.
+        self._cb_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._cb_worker = Thread(
+            target=self._callback_worker, name="hotkey-callbacks", daemon=True
+        )
+        self._cb_worker.start()
+        # Скан-коды клавиш, отпускание которых может разорвать комбинацию
+        self._release_scan_codes: FrozenSet[int] = frozenset()
+        # Метка последнего обработанного release для гашения «пачки»
+        # одновременно отпущенных модификаторов
+        self._last_release_ts: float = 0.0
 
     # ------------------------------------------------------------------ public
 
@@ -78,6 +110,7 @@ class HotKeyManager:
         if self._running:
             return
         self._running = True
+        self._stop_event.clear()
         self._listener_thread = Thread(target=self._listen_loop, daemon=True)
         self._listener_thread.start()
 
@@ -88,6 +121,7 @@ class HotKeyManager:
         if not self._running:
             return
         self._running = False
+        self._stop_event.set()
         keyboard.unhook_all()
 
     # ---------------------------------------------------------------- internal
@@ -132,14 +166,14 @@ class HotKeyManager:
         # Мы можем зарегистрировать оба хоткея на нажатие.
         keyboard.add_hotkey(
             self.record_hotkey,
-            self.callbacks.on_record_press,
+            partial(self._cb_queue.put, self.callbacks.on_record_press),
             suppress=False,
             trigger_on_release=False
         )
-        
+
         keyboard.add_hotkey(
             self.record_idea_hotkey,
-            self.callbacks.on_record_idea_press,
+            partial(self._cb_queue.put, self.callbacks.on_record_idea_press),
             suppress=False,
             trigger_on_release=False
         )
@@ -148,7 +182,7 @@ class HotKeyManager:
         # Используем 'alt' (или 'left alt' / 'right alt')
         keyboard.on_press_key(
             "alt",
-            lambda e: self.callbacks.on_convert_to_idea(),
+            lambda e: self._cb_queue.put(self.callbacks.on_convert_to_idea),
             suppress=False
         )
         
@@ -179,31 +213,58 @@ class HotKeyManager:
         # Приложение (App) само разберется: если оно пишет "обычно", то остановит обычную запись.
         # Если пишет "идею", то остановит идею.
         
+        # Один сырой хук вместо шести on_release_key: каждое отпускание
+        # клавиши в системе проходит через ОДИН Python-вызов, а фильтрация
+        # идёт O(1)-проверкой скан-кода по готовому набору.
+        release_codes: set[int] = set()
         for key in ['ctrl', 'left windows', 'right windows', 'alt', 'left alt', 'right alt']:
-             keyboard.on_release_key(key, lambda e: self._handle_release(), suppress=False)
+            try:
+                release_codes.update(keyboard.key_to_scan_codes(key))
+            except Exception:
+                # Имя может не резолвиться на конкретной раскладке — пропускаем
+                pass
+        self._release_scan_codes = frozenset(release_codes)
+        keyboard.hook(self._on_raw_event)
 
         # Cancel
-        keyboard.add_hotkey(self.cancel_hotkey, self.callbacks.on_cancel, suppress=False)
+        keyboard.add_hotkey(
+            self.cancel_hotkey,
+            partial(self._cb_queue.put, self.callbacks.on_cancel),
+            suppress=False,
+        )
 
         # Toggle window
         keyboard.add_hotkey(
             self.toggle_window_hotkey,
-            self.callbacks.on_toggle_window,
+            partial(self._cb_queue.put, self.callbacks.on_toggle_window),
             suppress=False,
         )
 
         # Toggle debug
         keyboard.add_hotkey(
             self.toggle_debug_hotkey,
-            self.callbacks.on_toggle_debug,
+            partial(self._cb_queue.put, self.callbacks.on_toggle_debug),
             suppress=False,
         )
 
-        # Block until stop() is called; simple polling loop.
-        import time
+        # Блокируемся до stop() без опроса: поток спит в ожидании события
+        # и не просыпается 10 раз в секунду ради проверки флага.
+        self._stop_event.wait()
+
+    def _on_raw_event(self, event) -> None:
+        """
+        Единый обработчик сырых событий клавиатуры.
 
-        while self._running:
-            time.sleep(0.1)
+        Отбрасывает всё, кроме отпускания интересующих модификаторов,
+        и гасит «пачку» release-событий при одновременном отпускании
+        нескольких клавиш комбинации.
+        """
+        if getattr(event, "event_type", None) != "up":
+            return
+        if event.scan_code not in self._release_scan_codes:
+            return
+
+        self._handle_release()
 
     def _handle_release(self) -> None:
         """
@@ -211,7 +272,16 @@ class HotKeyManager:
         Проверяем, что комбинация ДЕЙСТВИТЕЛЬНО разорвана (хотя бы одна
         ключевая клавиша отпущена), прежде чем слать release.
         Это предотвращает мигание при нажатии Ctrl+Win+Alt.
+
+        Отпускание аккорда даёт до трёх release-событий почти одновременно;
+        все, что пришли в пределах 50 мс, схлопываются в один вызов
+        колбэков.
         """
+        now = time.monotonic()
+        if now - self._last_release_ts < 0.05:
+            return
+        self._last_release_ts = now
+
         # Проверяем, что хотя бы Ctrl или Win отпущены
         # (если только Alt отпущен, но Ctrl+Win ещё зажаты — запись продолжается)
         try:
@@ -225,14 +295,22 @@ class HotKeyManager:
         if ctrl_pressed and win_pressed:
             return
 
-        try:
-            self.callbacks.on_record_release()
-        except Exception:
-            pass
-        try:
-            self.callbacks.on_record_idea_release()
-        except Exception:
-            pass
+        self._cb_queue.put(self.callbacks.on_record_release)
+        self._cb_queue.put(self.callbacks.on_record_idea_release)
+
+    def _callback_worker(self) -> None:
+        """
+        Последовательно выполняет колбэки, снятые с очереди.
+
+        Сюда попадает всё, что регистрируют хуки: hook-поток keyboard
+        только кладёт callable и сразу возвращается к диспетчеризации.
+        """
+        while True:
+            cb = self._cb_queue.get()
+            try:
+                cb()
+            except Exception:
+                pass
 
     @staticmethod
     def _normalize_hotkey_main_key(hotkey: str) -> str:
@@ -2,8 +2,16 @@ import sys
 import os
 import time
 import threading
+import random
 import re
+from datetime import datetime
+import atexit
+import hashlib
+import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from queue import SimpleQueue
 from typing import Optional
 
 # SSL сертификаты для PyInstaller onefile сборки
@@ -21,17 +29,129 @@ from loguru import logger
 
 from config.settings import AppSettings
 from ui.floating_window import FloatingWindow
+from ui.theme import apply_app_theme
 from ui.system_tray import SystemTrayIcon
 from hotkey.hotkey_manager import HotKeyManager
 from audio.recorder import AudioRecorder
 from clipboard.clipboard_manager import ClipboardManager
-from recognition import create_recognizer
+from recognition import NonRetryableError, create_recognizer
 from recognition.postprocessor import TextPostprocessor
 from utils.logger import setup_logging
 from utils.recovery import RecoveryManager
 from utils.history import HistoryManager
 from utils.audio_processing import speed_up_audio
 
+# Фильтры «мусорных» ответов модели, компилируются один раз при импорте,
+# а не пересоздаются на каждое распознавание
+_BAD_RESPONSE_PATTERNS = (
+    re.compile(r"(?iu)\s*продолжение\s+следует[\s\.*]*"),
+    re.compile(r"(?iu)\s*субтитры\s+сделал\s+dimatorzok[\s\.*]*"),
+)
+
+# Максимум записей в кэше результатов распознавания
+_ASR_CACHE_MAX = 256
+
+# Параметры каскада ретраев распознавания
+_MAX_ATTEMPTS = 5
+# База экспоненциального backoff: 0.5 → 1 → 2 → 4 с (+ джиттер).
+# Транзиентный сбой ретраится быстро, затяжной — всё реже.
+_RETRY_DELAY_SEC = 0.5
+_BACKEND_SWITCH_DELAY_SEC = 1
+
+
+def _sync_postprocess_creds(post_cfg, rec_cfg) -> None:
+    """
+    Прокидывает в postprocess.* ключ, model_process и base_url из
+    recognition.* для выбранного LLM-backend'а.
+
+    Общая точка для старта приложения и сохранения настроек: backend
+    нормализуется один раз, логика не дублируется по двум местам.
+    """
+    backend = (post_cfg.llm_backend or "").lower()
+
+    if backend == "groq":
+        # один ключ Groq: берём из recognition.groq.api_key
+        setattr(post_cfg.groq, "api_key", rec_cfg.groq.api_key)
+        # модель LLM: из recognition.groq.model_process
+        if not getattr(post_cfg.groq, "model_process", ""):
+            setattr(post_cfg.groq, "model_process", rec_cfg.groq.model_process)
+    elif backend == "openai":
+        # ключ для LLM всегда берём из поля OpenAI API key (recognition.openai.api_key)
+        setattr(post_cfg.openai, "api_key", rec_cfg.openai.api_key)
+        # модель LLM
+        if not getattr(post_cfg.openai, "model_process", ""):
+            setattr(post_cfg.openai, "model_process", rec_cfg.openai.model_process)
+        # базовый URL LLM = тот же, что и у ASR
+        setattr(post_cfg.openai, "base_url", rec_cfg.openai.base_url)
+
+
+class _AppendLog:
+    """
+    Append-only текстовый лог с фоновой записью.
+
+    Дескриптор открывается один раз, размер ведётся счётчиком байт
+    (без stat() на каждую запись), строки пишутся отдельным потоком
+    через очередь — путь распознавания не блокируется на диске.
+    Ротация по порогу: close → rename в .1 → reopen.
+
+    Файл открыт в бинарном режиме: строка кодируется в UTF-8 ровно один
+    раз (и для записи, и для счётчика), без текстовой прослойки io.
+    """
+
+    MAX_BYTES = 3 * 1024 * 1024
+
+    def __init__(self, path: Path, thread_name: str) -> None:
+        self._path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._fp = path.open("ab")
+        try:
+            # Единственный stat за всё время жизни лога — дальше размер
+            # ведёт счётчик байт
+            self._bytes_written = os.path.getsize(path)
+        except OSError:
+            self._bytes_written = 0
+        self._queue: SimpleQueue = SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._writer_loop, name=thread_name, daemon=True
+        )
+        self._thread.start()
+        # Не bound-метод self._fp.flush: после ротации тот объект закрыт,
+        # а флашить надо ТЕКУЩИЙ дескриптор на момент выхода
+        atexit.register(self._flush_current)
+
+    def write(self, line: str) -> None:
+        self._queue.put(line)
+
+    def _flush_current(self) -> None:
+        try:
+            self._fp.flush()
+        except ValueError:
+            # Дескриптор уже закрыт — флашить нечего
+            pass
+
+    def _writer_loop(self) -> None:
+        while True:
+            line = self._queue.get()
+            try:
+                data = line.encode("utf-8")
+                self._fp.write(data)
+                self._fp.flush()
+                self._bytes_written += len(data)
+                if self._bytes_written > self.MAX_BYTES:
+                    self._rotate()
+            except Exception as exc:  # noqa: BLE001
+                logger.error("Failed to write log {}: {}", self._path, exc)
+
+    def _rotate(self) -> None:
+        self._fp.close()
+        try:
+            # os.replace атомарен и на POSIX, и на Windows
+            os.replace(self._path, self._path.with_name(self._path.name + ".1"))
+        except OSError:
+            pass
+        self._fp = self._path.open("ab")
+        self._bytes_written = 0
+
 
 class App(QObject):
     # Сигналы для безопасного обновления UI из других потоков
@@ -55,6 +175,8 @@ class App(QObject):
     def __init__(self) -> None:
         super().__init__()
         self.qt_app = QApplication(sys.argv)
+        # Единый QSS приложения: диалоги больше не парсят свои стили
+        apply_app_theme(self.qt_app)
 
         # Определяем базовую директорию приложения:
         # - в dev-режиме: корень проекта (родитель src)
@@ -81,6 +203,18 @@ class App(QObject):
         # History manager
         self.history_manager = HistoryManager(self.base_dir)
 
+        # Кэш результатов распознавания по хэшу аудио: ретрай и повторная
+        # обработка recovery-файла не ходят в API за уже известным текстом.
+        # Переживает перезапуск через cache/asr.jsonl.
+        self._asr_cache_path = self.base_dir / "cache" / "asr.jsonl"
+        self._asr_cache: OrderedDict = self._load_asr_cache()
+
+        # Текстовые логи распознаваний и идей: долгоживущие дескрипторы
+        # с фоновой дозаписью вместо read-prepend-rewrite на каждую запись
+        log_dir = self.base_dir / "logs"
+        self._transcript_log = _AppendLog(log_dir / "transcripts.log", "transcript-log")
+        self._ideas_log = _AppendLog(log_dir / "ideas.log", "ideas-log")
+
         # Core components
         self.window = FloatingWindow(self.settings.ui, self.history_manager)
         # Устанавливаем начальное состояние постпроцессинга
@@ -95,28 +229,15 @@ class App(QObject):
         self._recognizers = {}
         primary_backend = (self.settings.recognition.backend or "groq").lower()
         self._recognizers[primary_backend] = self.recognizer
+        # Порядок каскада — чистая функция настроек, пересчитывается
+        # только при их изменении, а не на каждую запись
+        self._ordered_backends = self._compute_ordered_backends()
 
         # Постпроцессинг текста.
         # ВАЖНО: сразу прокидываем в postprocess.* тот же ключ, model_process и base_url,
         # что и в recognition.*, чтобы LLM работал уже при первом запуске.
         post_cfg = self.settings.postprocess
-        rec_cfg = self.settings.recognition
-
-        if (post_cfg.llm_backend or "").lower() == "groq":
-            # один ключ Groq: берём из recognition.groq.api_key
-            setattr(post_cfg.groq, "api_key", rec_cfg.groq.api_key)
-            # модель LLM: из recognition.groq.model_process
-            if not getattr(post_cfg.groq, "model_process", ""):
-                setattr(post_cfg.groq, "model_process", rec_cfg.groq.model_process)
-
-        if (post_cfg.llm_backend or "").lower() == "openai":
-            # ключ для LLM всегда берём из поля OpenAI API key (recognition.openai.api_key)
-            setattr(post_cfg.openai, "api_key", rec_cfg.openai.api_key)
-            # модель LLM
-            if not getattr(post_cfg.openai, "model_process", ""):
-                setattr(post_cfg.openai, "model_process", rec_cfg.openai.model_process)
-            # базовый URL LLM = тот же, что и у ASR
-            setattr(post_cfg.openai, "base_url", rec_cfg.openai.base_url)
+        _sync_postprocess_creds(post_cfg, self.settings.recognition)
 
         self.postprocessor = TextPostprocessor(post_cfg)
 
@@ -137,7 +258,13 @@ class App(QObject):
         self._is_recording: bool = False
         self._is_idea: bool = False # True, if the current recording is an idea
         self._last_audio_data: Optional[any] = None
-        self._processing_lock = threading.Lock()
+        # Один долгоживущий worker вместо нового threading.Thread на каждую
+        # запись: очередь пула сериализует обработку сама, отдельный
+        # _processing_lock больше не нужен
+        self._processing_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="asr")
+        # Отдельный worker для «хвостовой» работы после распознавания
+        # (история, идеи, текстовый лог, удаление recovery-файла)
+        self._log_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log")
 
         # Hotkeys
         self.hotkeys = HotKeyManager(
@@ -181,6 +308,14 @@ class App(QObject):
         # Check for recovery files on startup
         self._check_recovery_files()
 
+        # Прогрев: fallback-распознаватель и TLS-соединения к API
+        # открываются заранее, чтобы первое нажатие хоткея не платило
+        # за создание клиента и handshake
+        if getattr(self.settings.recognition, "prewarm", True):
+            threading.Thread(
+                target=self._prewarm_recognizers, name="prewarm", daemon=True
+            ).start()
+
     # --------------------------------------------------------------------- UI
 
     def _on_text_updated(self, raw_text: str, processed_text: str) -> None:
@@ -228,35 +363,39 @@ class App(QObject):
         if new_settings is None:
             return
 
+        # Запоминаем старые блоки для диффа: датаклассы сравниваются
+        # по значению, диалог строит новые объекты через replace()
+        old_rec = self.settings.recognition
+        old_post = self.settings.postprocess
+
         # обновляем настройки в памяти
         self.settings = new_settings
-        
+
         # сохраняем в config.yaml
         AppSettings.save_default(self.settings)
-        
-        # пересоздаём recognizer и postprocessor с учётом новых настроек
-        # и сбрасываем кэш распознавателей по backend'ам.
-        self._recognizers = {}
-        self.recognizer = create_recognizer(self.settings.recognition)
-        primary_backend = (self.settings.recognition.backend or "groq").lower()
-        self._recognizers[primary_backend] = self.recognizer
-        
-        post_cfg = self.settings.postprocess
-        rec_cfg = self.settings.recognition
-
-        if (post_cfg.llm_backend or "").lower() == "groq":
-            setattr(post_cfg.groq, "api_key", rec_cfg.groq.api_key)
-            if not getattr(post_cfg.groq, "model_process", ""):
-                setattr(post_cfg.groq, "model_process", rec_cfg.groq.model_process)
 
-        if (post_cfg.llm_backend or "").lower() == "openai":
-            setattr(post_cfg.openai, "api_key", rec_cfg.openai.api_key)
-            if not getattr(post_cfg.openai, "model_process", ""):
-                setattr(post_cfg.openai, "model_process", rec_cfg.openai.model_process)
-            # базовый URL LLM = тот же, что и у ASR
-            setattr(post_cfg.openai, "base_url", rec_cfg.openai.base_url)
-
-        self.postprocessor = TextPostprocessor(post_cfg)
+        # Пересоздаём recognizer'ы только если распознавание реально
+        # изменилось: смена прозрачности окна не должна ронять живые
+        # keepalive-соединения и кэш распознавателей
+        rec_cfg = self.settings.recognition
+        rec_unchanged = (
+            (old_rec.backend or "groq").lower() == (rec_cfg.backend or "groq").lower()
+            and old_rec.groq == rec_cfg.groq
+            and old_rec.openai == rec_cfg.openai
+        )
+        if not rec_unchanged:
+            self._recognizers = {}
+            self.recognizer = create_recognizer(rec_cfg)
+            primary_backend = (rec_cfg.backend or "groq").lower()
+            self._recognizers[primary_backend] = self.recognizer
+        self._ordered_backends = self._compute_ordered_backends()
+
+        # Постпроцессор тоже пересобираем только при изменении его
+        # настроек или ключей recognition, которые в него прокинуты
+        post_cfg = self.settings.postprocess
+        if not (rec_unchanged and old_post == post_cfg):
+            _sync_postprocess_creds(post_cfg, rec_cfg)
+            self.postprocessor = TextPostprocessor(post_cfg)
 
         # если теперь ключи заданы — убрать предупреждающую надпись
         backend = (self.settings.recognition.backend or "groq").lower()
@@ -285,14 +424,11 @@ class App(QObject):
 
     def _retry_processing(self) -> None:
         """Запускает повторную обработку последнего записанного аудио."""
-        from loguru import logger
-
         if self._last_audio_data:
             logger.info("Retrying processing for the last audio data.")
-            # Запускаем в новом потоке, чтобы не блокировать UI
+            # Отдаём в пул обработки, чтобы не блокировать UI
             # При ретрае считаем, что это не идея (или можно сохранить состояние, но для MVP так)
-            thread = threading.Thread(target=self._process_audio, args=(self._last_audio_data, False, None))
-            thread.start()
+            self._processing_pool.submit(self._process_audio, self._last_audio_data, False, None)
         else:
             logger.warning("Retry requested, but no audio data is available.")
             self.state_changed.emit("idle")
@@ -317,7 +453,13 @@ class App(QObject):
 
             # Speed up audio x2 if enabled in settings
             if self.settings.audio.speedup_x2:
-                processed_audio = speed_up_audio(audio_data, factor=2.0)
+                try:
+                    processed_audio = speed_up_audio(audio_data, factor=2.0)
+                except Exception:
+                    # Запись дороже ускорения: DSP-сбой логируем с полным
+                    # трейсбеком и обрабатываем оригинальное аудио
+                    logger.exception("speed_up_audio failed, processing original audio")
+                    processed_audio = audio_data
             else:
                 processed_audio = audio_data
 
@@ -332,8 +474,7 @@ class App(QObject):
                 recovery_path = None
 
             if len(processed_audio.samples) > 0:
-                thread = threading.Thread(target=self._process_audio, args=(processed_audio, final_is_idea, recovery_path))
-                thread.start()
+                self._processing_pool.submit(self._process_audio, processed_audio, final_is_idea, recovery_path)
             else:
                 logger.warning("Empty audio recorded, skipping processing.")
                 self.state_changed.emit("idle")
@@ -394,142 +535,336 @@ class App(QObject):
         recognizer = create_recognizer(tmp_cfg)
         cache[backend] = recognizer
         return recognizer
-    
-    # ----------------------------------------------------------- Processing
-    
-    def _process_audio(self, audio_data, is_idea: bool, recovery_path: Optional[Path] = None) -> None:
+
+    def _compute_ordered_backends(self) -> tuple:
+        """Порядок каскада: выбранный backend, затем остальные известные."""
+        primary = (self.settings.recognition.backend or "groq").lower()
+        all_backends = ["groq", "openai"]
+        cascade = [b for b in [primary] + all_backends if b in all_backends]
+        seen: set = set()
+        return tuple(b for b in cascade if not (b in seen or seen.add(b)))
+
+    def _hedged_transcribe(self, backends: list, audio_data):
         """
-        Синхронная обработка аудио.
+        Хеджированная первая попытка: запрос уходит на все backend'ы
+        одновременно, берётся первый успешный ответ.
+
+        Возвращает (raw_text, used_backend, ejected) — ejected это
+        backend'ы, упавшие с NonRetryableError (их надо убрать из
+        каскада). Проигравший запрос прервать нельзя (httpx уже отправил
+        тело) — он дорабатывает в фоне и просто игнорируется.
+        """
+        pool = getattr(self, "_hedge_pool", None)
+        if pool is None:
+            pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="hedge")
+            self._hedge_pool = pool
+
+        futures = {}
+        for backend in backends:
+            recognizer = self._get_or_create_recognizer(backend)
+            futures[pool.submit(recognizer.transcribe, audio_data)] = backend
+
+        ejected: list = []
+        for future in as_completed(futures):
+            backend = futures[future]
+            try:
+                text = future.result()
+                logger.info("Hedged recognition won by backend: {}", backend)
+                return text, backend, ejected
+            except NonRetryableError as exc:
+                logger.error("Non-retryable error on backend {}: {}", backend, exc)
+                ejected.append(backend)
+            except Exception as exc:
+                logger.error("Hedged recognition error on backend {}: {}", backend, exc)
+        return None, None, ejected
+
+    def _prewarm_recognizers(self) -> None:
         """
-        from loguru import logger
-        from pathlib import Path
-        from datetime import datetime
-        from recognition.postprocessor import TextPostprocessor as TP
+        Фоновый прогрев: конструирует fallback-распознаватель и открывает
+        keepalive-соединения к API-хостам лёгким HEAD-запросом.
 
-        # Wait for lock (queueing requests)
-        self._processing_lock.acquire(blocking=True)
+        Ответ не важен (404/405 — нормально): цель — DNS-резолв и TLS
+        handshake до первой записи, дальше соединение живёт в пуле.
+        """
+        from recognition.http_session import get_http_client
 
         try:
-            self._last_audio_data = audio_data
-            self.state_changed.emit("processing")
+            self._get_or_create_recognizer("openai")
+        except Exception as e:
+            logger.debug("Fallback recognizer pre-warm failed: {}", e)
+
+        urls = ["https://api.groq.com"]
+        openai_base = (self.settings.recognition.openai.base_url or "").strip()
+        if openai_base:
+            urls.append(openai_base)
 
-            # ------------------------ вычисляем длительность аудио -----------------
+        client = get_http_client()
+        for url in urls:
             try:
-                import numpy as _np
-                samples = audio_data.samples
-                sample_rate = getattr(audio_data, "sample_rate", 16000)
-                total_samples = samples.shape[0]
-                audio_duration_sec = float(total_samples) / float(sample_rate)
-            except Exception as exc:
-                logger.exception("Failed to compute audio duration: {}", exc)
-                audio_duration_sec = -1.0
+                client.head(url, timeout=5)
+                logger.info("Pre-warmed connection to {}", url)
+            except Exception as e:
+                logger.debug("Pre-warm of {} failed: {}", url, e)
 
-            # ------------------------ каскад backend'ов с ретраями ----------------
-            primary = (self.settings.recognition.backend or "groq").lower()
-            all_backends = ["groq", "openai"]
-            cascade = [b for b in [primary] + all_backends if b in all_backends]
-            seen = set()
-            ordered_backends = [b for b in cascade if not (b in seen or seen.add(b))]
-
-            MAX_ATTEMPTS = 5
-            RETRY_DELAY_SEC = 2
-            BACKEND_SWITCH_DELAY_SEC = 1
-
-            last_error: str | None = None
-            raw_text: str | None = None
-            used_backend: str | None = None
-
-            for attempt in range(MAX_ATTEMPTS):
-                logger.info(f"Recognition attempt #{attempt + 1}/{MAX_ATTEMPTS}")
-                for backend in ordered_backends:
+    # ----------------------------------------------------------- ASR cache
+
+    def _load_asr_cache(self) -> OrderedDict:
+        """
+        Читает cache/asr.jsonl в OrderedDict (старые записи первыми).
+
+        Файл append-only; если он разросся сильнее, чем вдвое против
+        лимита записей, переписываем его только удержанными записями.
+        """
+        cache: OrderedDict = OrderedDict()
+        n_lines = 0
+        try:
+            with self._asr_cache_path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    n_lines += 1
                     try:
-                        logger.info("Trying recognition backend: {}", backend)
-                        recognizer = self._get_or_create_recognizer(backend)
-                        raw_text = recognizer.transcribe(audio_data)
-                        used_backend = backend
-                        logger.info("Recognition succeeded with backend: {}", backend)
-                        break  # Exit inner loop (backends)
-                    except Exception as exc:
-                        logger.error("Recognition error on backend {}: {}", backend, exc)
-                        last_error = str(exc)
-                        time.sleep(BACKEND_SWITCH_DELAY_SEC)
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
                         continue
-                
-                if raw_text is not None:
-                    break  # Exit outer loop (attempts)
+                    key = entry.get("key")
+                    if key:
+                        cache[key] = (entry.get("backend") or "", entry.get("text") or "")
+                        cache.move_to_end(key)
+        except FileNotFoundError:
+            return cache
+        except Exception as e:
+            logger.error("Failed to load ASR cache: {}", e)
+            return cache
+
+        while len(cache) > _ASR_CACHE_MAX:
+            cache.popitem(last=False)
+
+        if n_lines > 2 * _ASR_CACHE_MAX:
+            try:
+                with self._asr_cache_path.open("w", encoding="utf-8") as f:
+                    for key, (backend, text) in cache.items():
+                        f.write(self._asr_cache_line(key, backend, text))
+            except Exception as e:
+                logger.error("Failed to compact ASR cache: {}", e)
+        return cache
+
+    @staticmethod
+    def _asr_cache_line(key: str, backend: str, text: str) -> str:
+        return json.dumps(
+            {"key": key, "backend": backend, "text": text},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ) + "\n"
+
+    def _asr_cache_put(self, key: str, backend: str, raw_text: str) -> None:
+        self._asr_cache[key] = (backend, raw_text)
+        self._asr_cache.move_to_end(key)
+        while len(self._asr_cache) > _ASR_CACHE_MAX:
+            self._asr_cache.popitem(last=False)
+        try:
+            self._asr_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._asr_cache_path.open("a", encoding="utf-8") as f:
+                f.write(self._asr_cache_line(key, backend, raw_text))
+        except Exception as e:
+            logger.error("Failed to persist ASR cache entry: {}", e)
 
-                if attempt < MAX_ATTEMPTS - 1:
-                    logger.info(f"Attempt #{attempt + 1} failed. Retrying in {RETRY_DELAY_SEC} seconds...")
-                    time.sleep(RETRY_DELAY_SEC)
+    # ----------------------------------------------------------- Processing
 
-            if raw_text is None:
-                msg = "Ошибка соединения. Настройте соединение и попробуйте еще раз."
-                self.state_changed.emit("error")
-                self.message_shown.emit(msg, 0)  # 0 timeout to keep it visible
-                self.window.show_retry_button()
-                # If we failed, we should NOT retry automatically or loop forever.
-                # The user can click retry manually.
-                return
+    def _process_audio(self, audio_data, is_idea: bool, recovery_path: Optional[Path] = None) -> None:
+        """
+        Синхронная обработка аудио.
+        """
+        self._last_audio_data = audio_data
+        self.state_changed.emit("processing")
+
+        # ------------------------ вычисляем длительность аудио -----------------
+        # samples — всегда ndarray: обычное деление по первой оси,
+        # без try/except и лишних float()-приведений
+        sample_rate = getattr(audio_data, "sample_rate", 16000) or 16000
+        audio_duration_sec = audio_data.samples.shape[0] / sample_rate
+
+        # ------------------------ кэш распознавания ---------------------------
+        # Ретрай и повтор recovery-файла несут тот же массив сэмплов:
+        # текст берём по хэшу аудио вместо нового сетевого запроса
+        cache_key = hashlib.blake2b(
+            audio_data.samples.tobytes(), digest_size=16
+        ).hexdigest()
+        cached = self._asr_cache.get(cache_key)
+
+        # ------------------------ каскад backend'ов с ретраями ----------------
+        last_error: str | None = None
+        raw_text: str | None = None
+        used_backend: str | None = None
+
+        if cached is not None:
+            used_backend, raw_text = cached
+            self._asr_cache.move_to_end(cache_key)
+            logger.info("ASR cache hit (backend={}), skipping API call", used_backend)
+
+        # Backend'ы с ошибками 401/400 и кривой конфигурацией выбывают из
+        # каскада сразу: повтор не починит неверный ключ или base_url
+        retryable_backends = list(self._ordered_backends)
+
+        # Хеджирование (recognition.hedge): первая попытка гонит запрос на
+        # оба backend'а параллельно — латентность равна минимуму из двух.
+        # Дороже по квоте, поэтому по умолчанию выключено; при неудаче
+        # падаем в обычный последовательный каскад ниже.
+        if (
+            raw_text is None
+            and len(retryable_backends) > 1
+            and getattr(self.settings.recognition, "hedge", False)
+        ):
+            raw_text, used_backend, ejected = self._hedged_transcribe(
+                retryable_backends, audio_data
+            )
+            for backend in ejected:
+                retryable_backends.remove(backend)
+
+        for attempt in range(_MAX_ATTEMPTS):
+            if raw_text is not None or not retryable_backends:
+                break
+            logger.info(f"Recognition attempt #{attempt + 1}/{_MAX_ATTEMPTS}")
+            for backend in list(retryable_backends):
+                try:
+                    logger.info("Trying recognition backend: {}", backend)
+                    recognizer = self._get_or_create_recognizer(backend)
+                    raw_text = recognizer.transcribe(audio_data)
+                    used_backend = backend
+                    logger.info("Recognition succeeded with backend: {}", backend)
+                    break  # Exit inner loop (backends)
+                except NonRetryableError as exc:
+                    logger.error("Non-retryable error on backend {}: {}", backend, exc)
+                    last_error = str(exc)
+                    retryable_backends.remove(backend)
+                    continue
+                except Exception as exc:
+                    logger.error("Recognition error on backend {}: {}", backend, exc)
+                    last_error = str(exc)
+                    time.sleep(_BACKEND_SWITCH_DELAY_SEC)
+                    continue
 
-            from loguru import logger as _logger
+            if raw_text is not None:
+                break  # Exit outer loop (attempts)
+
+            if attempt < _MAX_ATTEMPTS - 1 and retryable_backends:
+                # Экспоненциальный backoff с джиттером: быстрые повторы на
+                # транзиентных сбоях, рассинхронизация с лимитами API
+                delay = min(8.0, _RETRY_DELAY_SEC * 2 ** attempt) + random.uniform(0, 0.25)
+                logger.info(f"Attempt #{attempt + 1} failed. Retrying in {delay:.2f} seconds...")
+                time.sleep(delay)
+
+        if raw_text is None:
+            msg = "Ошибка соединения. Настройте соединение и попробуйте еще раз."
+            self.state_changed.emit("error")
+            self.message_shown.emit(msg, 0)  # 0 timeout to keep it visible
+            self.window.show_retry_button()
+            # If we failed, we should NOT retry automatically or loop forever.
+            # The user can click retry manually.
+            return
 
-            try:
-                # 2) regex-очистка (базовый препроцессинг всегда)
-                regex_text = TP._simple_cleanup(raw_text or "")
+        if cached is None and used_backend is not None:
+            self._asr_cache_put(cache_key, used_backend, raw_text)
 
-                # Если пришёл пустой запрос/пустая транскрибация — показываем заглушку.
-                # ВАЖНО: это делаем ДО LLM, чтобы не гонять модель на пустом тексте.
-                if not regex_text.strip():
-                    regex_text = "Продолжение следует..."
+        try:
+            # 2) regex-очистка (базовый препроцессинг всегда)
+            regex_text = TextPostprocessor._simple_cleanup(raw_text or "")
+
+            # Если пришёл пустой запрос/пустая транскрибация — показываем заглушку.
+            # ВАЖНО: это делаем ДО LLM, чтобы не гонять модель на пустом тексте.
+            if not regex_text.strip():
+                regex_text = "Продолжение следует..."
+
+            # 3) LLM-постпроцессинг (если включён в конфиге).
+            # В режиме eager_paste модель гоняется в фоне, а regex-вариант
+            # сразу уходит в буфер обмена и вставку: кто вставляет сразу,
+            # ждёт только распознавание, не второй сетевой round-trip.
+            # Тривиальный результат (случайное нажатие, шум) не гоняем
+            # через LLM: короткий текст модель всё равно не улучшит,
+            # а round-trip стоит до секунд
+            post_cfg = self.settings.postprocess
+            skip_llm = (
+                len((raw_text or "").strip()) < getattr(post_cfg, "min_chars_for_llm", 8)
+                or audio_duration_sec < getattr(post_cfg, "min_duration_sec", 0.4)
+            )
+            if skip_llm:
+                logger.info(
+                    "Skipping LLM postprocess: trivial result ({} chars, {:.2f}s)",
+                    len((raw_text or "").strip()),
+                    audio_duration_sec,
+                )
 
-                # 3) LLM-постпроцессинг (если включён в конфиге)
-                processed_text = regex_text
-                try:
+            eager = bool(getattr(self.settings.postprocess, "eager_paste", False)) and not skip_llm
+            llm_future = None
+            if eager:
+                llm_future = self._log_pool.submit(self.postprocessor.process, raw_text or "")
+                self.text_updated.emit(raw_text or "", regex_text)
+                self.state_changed.emit("ready")
+
+                def paste_early(text):
+                    self.clipboard.copy(text)
+                    self.clipboard.paste()
+
+                threading.Thread(target=paste_early, args=(regex_text,), daemon=True).start()
+
+            processed_text = regex_text
+            try:
+                if skip_llm:
+                    pass
+                elif llm_future is not None:
+                    processed_text = llm_future.result()
+                else:
                     processed_text = self.postprocessor.process(raw_text or "")
-                except RuntimeError as exc:
-                    _logger.error("LLM postprocess error: {}", exc)
-                    self.message_shown.emit(str(exc), 3000)
-                except Exception as exc:  # noqa: BLE001
-                    _logger.exception("Unexpected LLM postprocess error: {}", exc)
-                    self.message_shown.emit("Ошибка LLM-постпроцессинга. См. логи.", 3000)
-
-                # Фильтрация нежелательных ответов модели
-                if processed_text:
-                    # Если ответ содержит только "продолжение следует" или "Субтитры сделал DimaTorzok" (с любыми знаками препинания)
-                    # то мы его полностью игнорируем (не добавляем в буфер и не вставляем).
-                    bad_patterns = [
-                        r"(?iu)\s*продолжение\s+следует[\s\.*]*",
-                        r"(?iu)\s*субтитры\s+сделал\s+dimatorzok[\s\.*]*"
-                    ]
-                    should_skip = False
-                    for pattern in bad_patterns:
-                        if re.fullmatch(pattern, processed_text):
-                            should_skip = True
-                            break
+            except RuntimeError as exc:
+                logger.error("LLM postprocess error: {}", exc)
+                self.message_shown.emit(str(exc), 3000)
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("Unexpected LLM postprocess error: {}", exc)
+                self.message_shown.emit("Ошибка LLM-постпроцессинга. См. логи.", 3000)
+
+            # Фильтрация нежелательных ответов модели
+            if processed_text:
+                # Если ответ содержит только "продолжение следует" или "Субтитры сделал DimaTorzok" (с любыми знаками препинания)
+                # то мы его полностью игнорируем (не добавляем в буфер и не вставляем).
+                should_skip = False
+                for pattern in _BAD_RESPONSE_PATTERNS:
+                    if pattern.fullmatch(processed_text):
+                        should_skip = True
+                        break
                     
-                    if should_skip:
-                        logger.info("Skipping model response: {}", processed_text)
-                        self.state_changed.emit("ready")
-                        if recovery_path:
-                            self.recovery_manager.cleanup(recovery_path)
-                        return
-
-                # 4) показать оба варианта в окне (через сигнал)
-                self.text_updated.emit(raw_text or "", processed_text or "")
-
-                # 5) положить ОБРАБОТАННЫЙ текст в буфер обмена (ВСЕГДА)
-                # 5) положить ОБРАБОТАННЫЙ текст в буфер обмена (ВСЕГДА)
-                # Выполняем в отдельном потоке, чтобы не блокировать основной цикл обработки
-                def update_clipboard_and_paste(text):
-                    self.clipboard.copy(text)
+                if should_skip:
+                    logger.info("Skipping model response: {}", processed_text)
+                    self.state_changed.emit("ready")
+                    if recovery_path:
+                        self.recovery_manager.cleanup(recovery_path)
+                    return
+
+            # 4) показать оба варианта в окне и сразу вернуть "ready":
+            # UI готов, как только текст известен, — буфер обмена и диск
+            # не стоят между распознаванием и индикатором готовности
+            self.text_updated.emit(raw_text or "", processed_text or "")
+            self.state_changed.emit("ready")
+
+            # 5) положить ОБРАБОТАННЫЙ текст в буфер обмена (ВСЕГДА)
+            # Выполняем в отдельном потоке, чтобы не блокировать основной цикл обработки.
+            # При ранней вставке regex-вариант уже вставлен — финальный текст
+            # только подменяет буфер, без второго paste в активное окно.
+            def update_clipboard_and_paste(text):
+                self.clipboard.copy(text)
+                if not eager:
                     self.clipboard.paste()
 
-                threading.Thread(target=update_clipboard_and_paste, args=(processed_text or "",), daemon=True).start()
-                
+            threading.Thread(target=update_clipboard_and_paste, args=(processed_text or "",), daemon=True).start()
+
+            # 6-8) история, идеи, текстовый лог и удаление recovery-файла —
+            # на логгерном пуле, чтобы worker распознавания освободился
+            # для следующей записи
+            def finish_io():
                 # Save to history
                 self.history_manager.add_item(raw_text or "", processed_text or "")
 
-                # 7) если это была идея — отправить на webhook или добавить в список идей
+                # Если это была идея — отправить на webhook или добавить в список идей
                 if is_idea:
                     webhook_url = (self.settings.integrations.n8n_webhook_url or "").strip()
                     if webhook_url:
@@ -540,68 +875,27 @@ class App(QObject):
                         self.idea_added.emit(processed_text or "")
                         self._log_idea(processed_text or "")
 
-                # 8) сохранить распознавание в отдельный текстовый лог (новые сверху, макс 1 МБ)
-                try:
-                    if getattr(sys, "frozen", False):
-                        base_dir = Path(sys.executable).resolve().parent
-                    else:
-                        base_dir = Path(__file__).resolve().parents[1]
-
-                    log_dir = base_dir / "logs"
-                    log_dir.mkdir(parents=True, exist_ok=True)
-                    transcript_path = log_dir / "transcripts.log"
-
-                    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    backend_str = used_backend or (self.settings.recognition.backend or "unknown")
-                    
-                    new_entry = (
-                        f"[{timestamp}] backend={backend_str} "
-                        f"duration={audio_duration_sec:.3f}s\n"
-                        f"RAW: {(raw_text or '').strip()}\n"
-                        f"PROCESSED: {(processed_text or '').strip()}\n"
-                        "----------------------------------------\n"
-                    )
-
-                    # Читаем существующий контент
-                    existing_content = ""
-                    if transcript_path.exists():
-                        try:
-                            with transcript_path.open("r", encoding="utf-8") as f:
-                                existing_content = f.read()
-                        except Exception:
-                            pass
-
-                    # Добавляем новую запись в начало
-                    full_content = new_entry + existing_content
-
-                    # Обрезаем до 1 МБ
-                    max_size_bytes = 1024 * 1024
-                    if len(full_content) > max_size_bytes:
-                        cut_index = full_content.rfind('\n', 0, max_size_bytes)
-                        if cut_index != -1:
-                            full_content = full_content[:cut_index+1]
-                        else:
-                            full_content = full_content[:max_size_bytes]
-
-                    # Перезаписываем файл
-                    with transcript_path.open("w", encoding="utf-8") as f:
-                        f.write(full_content)
-
-                except Exception as exc:  # noqa: BLE001
-                    _logger.exception("Failed to update transcript log: {}", exc)
-
-                self.state_changed.emit("ready")
+                # Сохранить распознавание в текстовый лог (append, ротация по 3 МиБ)
+                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                backend_str = used_backend or (self.settings.recognition.backend or "unknown")
+                self._transcript_log.write(
+                    f"[{timestamp}] backend={backend_str} "
+                    f"duration={audio_duration_sec:.3f}s\n"
+                    f"RAW: {(raw_text or '').strip()}\n"
+                    f"PROCESSED: {(processed_text or '').strip()}\n"
+                    "----------------------------------------\n"
+                )
 
                 # If successful, delete recovery file
                 if recovery_path:
                     self.recovery_manager.cleanup(recovery_path)
 
-            except Exception as exc:  # noqa: BLE001
-                _logger.exception("Unexpected error during post-processing: {}", exc)
-                self.state_changed.emit("error")
-                self.message_shown.emit("Неизвестная ошибка постобработки. См. логи.", 3000)
-        finally:
-            self._processing_lock.release()
+            self._log_pool.submit(finish_io)
+
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Unexpected error during post-processing: {}", exc)
+            self.state_changed.emit("error")
+            self.message_shown.emit("Неизвестная ошибка постобработки. См. логи.", 3000)
 
     def _apply_webhook_mode(self) -> None:
         """Включает/выключает webhook mode в окне в зависимости от настроек."""
@@ -641,71 +935,45 @@ class App(QObject):
         threading.Thread(target=_do_send, daemon=True).start()
 
     def _log_idea(self, text: str):
-        """Appends an idea to the ideas.log file (newest at top, max 1MB)."""
-        from loguru import logger
-        from datetime import datetime
-        
+        """Appends an idea to the ideas.log file (append-only, rotation at 3 MiB)."""
         if not text.strip():
             return
-            
-        try:
-            # Use the same base_dir logic as in _process_audio
-            if getattr(sys, "frozen", False):
-                base_dir = Path(sys.executable).resolve().parent
-            else:
-                base_dir = Path(__file__).resolve().parents[1]
 
-            log_dir = base_dir / "logs"
-            log_dir.mkdir(parents=True, exist_ok=True)
-            idea_log_path = log_dir / "ideas.log"
-            
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            new_entry = f"[{timestamp}] {text.strip()}\n"
-            
-            # Читаем существующий контент
-            existing_content = ""
-            if idea_log_path.exists():
-                try:
-                    with idea_log_path.open("r", encoding="utf-8") as f:
-                        existing_content = f.read()
-                except Exception:
-                    pass
-
-            # Добавляем новую запись в начало
-            full_content = new_entry + existing_content
-
-            # Обрезаем до 1 МБ
-            max_size_bytes = 1024 * 1024
-            if len(full_content) > max_size_bytes:
-                cut_index = full_content.rfind('\n', 0, max_size_bytes)
-                if cut_index != -1:
-                    full_content = full_content[:cut_index+1]
-                else:
-                    full_content = full_content[:max_size_bytes]
-
-            # Перезаписываем файл
-            with idea_log_path.open("w", encoding="utf-8") as f:
-                f.write(full_content)
-                
-        except Exception as exc:
-            logger.exception("Failed to update idea log: {}", exc)
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._ideas_log.write(f"[{timestamp}] {text.strip()}\n")
 
     def _check_recovery_files(self) -> None:
         """
         Checks for existing recovery files and processes them.
         """
-        from loguru import logger
-        
         files = self.recovery_manager.get_recovery_files()
         if not files:
             return
 
         logger.info(f"Found {len(files)} recovery files. Processing...")
         
-        # Process files in a separate thread to not block UI startup
+        # Process files on the shared worker to not block UI startup
         def process_recovery():
             for filepath in files:
                 logger.info(f"Recovering file: {filepath}")
+
+                # Сначала сверяем хэш PCM-байтов файла с ASR-кэшем: при
+                # попадании текст уже известен — сэмплы не декодируем вовсе
+                key = self.recovery_manager.payload_digest(filepath)
+                cached = self._asr_cache.get(key) if key else None
+                if cached is not None:
+                    backend, raw_text = cached
+                    self._asr_cache.move_to_end(key)
+                    logger.info(
+                        "Recovery file {} matches ASR cache (backend={}), skipping decode",
+                        filepath, backend,
+                    )
+                    self.text_updated.emit(
+                        raw_text, TextPostprocessor._simple_cleanup(raw_text)
+                    )
+                    self.recovery_manager.cleanup(filepath)
+                    continue
+
                 audio_data = self.recovery_manager.load_audio(filepath)
                 
                 # Check if file is empty or invalid
@@ -722,7 +990,7 @@ class App(QObject):
                 # Small delay between files
                 time.sleep(1)
 
-        threading.Thread(target=process_recovery, daemon=True).start()
+        self._processing_pool.submit(process_recovery)
 
     # -------------------------------------------------------------- Debug
 
@@ -834,6 +1102,13 @@ class App(QObject):
 
     def quit(self) -> None:
         self.hotkeys.stop()
+        # Не ждём хвост очереди обработки: текущая запись и так
+        # сохранена recovery-менеджером и будет дообработана при старте
+        self._processing_pool.shutdown(wait=False, cancel_futures=True)
+        # Хвостовую работу (история, логи, cleanup) дописываем до конца
+        self._log_pool.shutdown(wait=True)
+        # Дожидаемся, пока фоновый writer доложит recovery-файлы на диск
+        self.recovery_manager.flush()
         self.qt_app.quit()
 
     def run(self) -> None:
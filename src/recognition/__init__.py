@@ -4,6 +4,7 @@ from typing import Protocol
 
 from audio.recorder import AudioData
 from config.settings import RecognitionConfig
+from recognition.errors import NonRetryableError
 from recognition.groq_api import GroqWhisperRecognizer
 from recognition.openai_api import OpenAIWhisperRecognizer
 
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+
+class NonRetryableError(RuntimeError):
+    """
+    Ошибка распознавания, которую бессмысленно ретраить.
+
+    Неверный API-ключ (401), отклонённый запрос (400) или пустой base_url
+    не исправятся повторной попыткой — каскад в _process_audio исключает
+    такой backend из дальнейших кругов вместо ожидания и повтора.
+    """
@@ -4,13 +4,15 @@ import io
 from dataclasses import dataclass
 from typing import Any, Tuple
 
+import httpx  # type: ignore[import]
 import numpy as np
-import requests  # type: ignore[import]
 import soundfile as sf  # type: ignore[import]
 from loguru import logger  # type: ignore[import]
 
 from config.settings import GroqRecognitionConfig
 from audio.recorder import AudioData
+from recognition.errors import NonRetryableError
+from recognition.http_session import get_http_client
 
 
 GROQ_TRANSCRIBE_URL = "https://api.groq.com/openai/v1/audio/transcriptions"
@@ -23,6 +25,10 @@ class GroqWhisperRecognizer:
 
     Converts AudioData to in-memory WAV and sends it to Groq Whisper endpoint.
 
+    Запросы идут через общий httpx.Client с keepalive-пулом (см.
+    recognition.http_session) — TLS-соединение переживает запись и не
+    устанавливается заново на каждый transcribe.
+
     Для удобства обработки ошибок метод transcribe возвращает только текст
     и выбрасывает осмысленные исключения с человекочитаемыми сообщениями.
     """
@@ -53,12 +59,14 @@ class GroqWhisperRecognizer:
             "language": self.config.language,
         }
 
+        client = get_http_client()
         last_exc: Exception | None = None
+        resp: httpx.Response | None = None
 
         for attempt in (1, 2):
             try:
                 logger.info("Groq request attempt {} to {}", attempt, GROQ_TRANSCRIBE_URL)
-                resp = requests.post(
+                resp = client.post(
                     GROQ_TRANSCRIBE_URL,
                     headers=headers,
                     files=files,
@@ -67,11 +75,11 @@ class GroqWhisperRecognizer:
                 )
                 # Если дошли до сюда — HTTP-запрос выполнен, выходим из цикла
                 break
-            except requests.Timeout as exc:  # type: ignore[attr-defined]
+            except httpx.TimeoutException as exc:
                 # Логируем кратко без полного traceback, чтобы не засорять консоль.
                 logger.error("Groq request timeout (attempt {}): {}", attempt, exc)
                 last_exc = exc
-            except requests.RequestException as exc:  # type: ignore[attr-defined]
+            except httpx.RequestError as exc:
                 # Любая другая сетевая ошибка Groq — тоже без гигантского stacktrace.
                 logger.error("Groq network error (attempt {}): {}", attempt, exc)
                 last_exc = exc
@@ -81,19 +89,22 @@ class GroqWhisperRecognizer:
                 time.sleep(1.0)
 
         # Если обе попытки не удались — поднимаем осмысленную ошибку
-        if last_exc is not None and "resp" not in locals():
-            if isinstance(last_exc, requests.Timeout):  # type: ignore[attr-defined]
+        if resp is None:
+            if isinstance(last_exc, httpx.TimeoutException):
                 raise RuntimeError("Groq: превышено время ожидания ответа.") from last_exc
             raise RuntimeError("Groq: сетевая ошибка при обращении к API.") from last_exc
 
         # HTTP-ошибки обрабатываем с разными сообщениями
         if resp.status_code == 401:
             logger.error("Groq returned 401 Unauthorized")
-            raise RuntimeError("Groq: неверный или отсутствующий API‑ключ (401).")
+            raise NonRetryableError("Groq: неверный или отсутствующий API‑ключ (401).")
+        if resp.status_code == 400:
+            logger.error("Groq returned 400 Bad Request: {}", resp.text[:500])
+            raise NonRetryableError("Groq: запрос отклонён сервером (400).")
         if resp.status_code == 429:
             logger.error("Groq returned 429 Too Many Requests")
             raise RuntimeError("Groq: превышен лимит запросов (429). Попробуйте позже.")
-        if not resp.ok:
+        if not resp.is_success:
             logger.error(
                 "Groq returned HTTP {}: {}",
                 resp.status_code,
@@ -122,4 +133,4 @@ class GroqWhisperRecognizer:
         buf = io.BytesIO()
         sf.write(buf, audio.samples, audio.sample_rate, format="WAV", subtype="PCM_16")
         buf.seek(0)
-        return buf.read()
\ No newline at end of file
+        return buf.read()
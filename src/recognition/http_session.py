@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+import httpx  # type: ignore[import]
+
+# Один httpx.Client на процесс для всех распознавателей: keepalive-пул
+# держит TLS-соединения к Groq/OpenAI открытыми между записями, так что
+# повторный запрос не платит ~100-300 мс за новый handshake. Пул сам
+# разводит соединения по хостам, поэтому клиент общий для backend'ов.
+_LIMITS = httpx.Limits(max_keepalive_connections=4)
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """Возвращает общий httpx.Client, создавая его при первом обращении."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(limits=_LIMITS)
+    return _client
@@ -4,13 +4,15 @@ import io
 from dataclasses import dataclass
 from typing import Any
 
+import httpx  # type: ignore[import]
 import numpy as np
-import requests  # type: ignore[import]
 import soundfile as sf  # type: ignore[import]
 from loguru import logger  # type: ignore[import]
 
 from audio.recorder import AudioData
 from config.settings import OpenAIRecognitionConfig
+from recognition.errors import NonRetryableError
+from recognition.http_session import get_http_client
 
 
 OPENAI_TRANSCRIBE_PATH = "/audio/transcriptions"
@@ -24,6 +26,9 @@ class OpenAIWhisperRecognizer:
     Конвертирует AudioData в in-memory WAV и отправляет на OpenAI-совместимый
     endpoint (base_url из конфига + /audio/transcriptions).
 
+    Запросы идут через общий httpx.Client с keepalive-пулом (см.
+    recognition.http_session).
+
     Использует:
       - recognition.openai.api_key
       - recognition.openai.model
@@ -43,7 +48,7 @@ class OpenAIWhisperRecognizer:
         """
         base = (self.config.base_url or "").strip()
         if not base:
-            raise RuntimeError(
+            raise NonRetryableError(
                 "OpenAI ASR: base_url не задан. Укажите 'OpenAI Base URL' в настройках."
             )
         base = base.rstrip("/")
@@ -67,29 +72,32 @@ class OpenAIWhisperRecognizer:
         }
 
         try:
-            resp = requests.post(
+            resp = get_http_client().post(
                 url,
                 headers=headers,
                 files=files,
                 data=data,
                 timeout=60,
             )
-        except requests.Timeout as exc:  # type: ignore[attr-defined]
+        except httpx.TimeoutException as exc:
             logger.exception("OpenAI request timeout: {}", exc)
             raise RuntimeError("OpenAI: превышено время ожидания ответа.") from exc
-        except requests.RequestException as exc:  # type: ignore[attr-defined]
+        except httpx.RequestError as exc:
             logger.exception("OpenAI network error: {}", exc)
             raise RuntimeError("OpenAI: сетевая ошибка при обращении к API.") from exc
 
         if resp.status_code == 401:
             logger.error("OpenAI returned 401 Unauthorized")
-            raise RuntimeError("OpenAI: неверный или отсутствующий API‑ключ (401).")
+            raise NonRetryableError("OpenAI: неверный или отсутствующий API‑ключ (401).")
+        if resp.status_code == 400:
+            logger.error("OpenAI returned 400 Bad Request: {}", resp.text[:500])
+            raise NonRetryableError("OpenAI: запрос отклонён сервером (400).")
         if resp.status_code == 429:
             logger.error("OpenAI returned 429 Too Many Requests")
             raise RuntimeError(
                 "OpenAI: превышен лимит запросов (429). Попробуйте позже."
             )
-        if not resp.ok:
+        if not resp.is_success:
             logger.error(
                 "OpenAI returned HTTP {}: {}",
                 resp.status_code,
@@ -119,10 +127,16 @@ class OpenAIWhisperRecognizer:
         samples = audio.samples
         if not isinstance(samples, np.ndarray):
             samples = np.asarray(samples, dtype=np.float32)
+        elif samples.dtype == np.int16:
+            # Recovery-файлы приходят в родном int16: libsndfile пишет его
+            # в PCM_16 как есть. Каст во float32 без деления на 32768 дал
+            # бы значения ±32767.0, которые libsndfile считает нормированными
+            # к [-1, 1] и клиппит — на выходе был бы прямоугольный мусор.
+            pass
         elif samples.dtype != np.float32:
             samples = samples.astype(np.float32)
 
         buf = io.BytesIO()
         sf.write(buf, samples, audio.sample_rate, format="WAV", subtype="PCM_16")
         buf.seek(0)
-        return buf.read()
\ No newline at end of file
+        return buf.read()
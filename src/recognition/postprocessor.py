@@ -9,6 +9,15 @@ from loguru import logger  # type: ignore[import]
 
 from config.settings import PostprocessConfig
 
+# Паттерны простой очистки компилируются один раз при импорте модуля.
+# _simple_cleanup вызывается на каждый результат распознавания, и хотя
+# re кэширует паттерны внутри, готовые объекты избавляют от поиска в
+# кэше и повторного разбора строки на каждый вызов.
+_RE_MULTI_SPACE = re.compile(r"\s+")
+_RE_SPACE_BEFORE_PUNCT = re.compile(r"\s+([,.!?;:])")
+_RE_NO_SPACE_AFTER_PUNCT = re.compile(r"([,.!?;:])([^\s])")
+_RE_BRACKET_ARTIFACT = re.compile(r"\[[^\]]+\]")
+
 
 @dataclass
 class TextPostprocessor:
@@ -79,16 +88,16 @@ class TextPostprocessor:
     @staticmethod
     def _simple_cleanup(text: str) -> str:
         # Удалить лишние пробелы
-        text = re.sub(r"\s+", " ", text).strip()
+        text = _RE_MULTI_SPACE.sub(" ", text).strip()
 
         # Пробел перед знаками препинания убрать
-        text = re.sub(r"\s+([,.!?;:])", r"\1", text)
+        text = _RE_SPACE_BEFORE_PUNCT.sub(r"\1", text)
 
         # Пробел после запятой/точки/восклицательного/вопросительного знака
-        text = re.sub(r"([,.!?;:])([^\s])", r"\1 \2", text)
+        text = _RE_NO_SPACE_AFTER_PUNCT.sub(r"\1 \2", text)
 
         # Удалить артефакты вида [BLANK_AUDIO] и т.п.
-        text = re.sub(r"\[[^\]]+\]", "", text).strip()
+        text = _RE_BRACKET_ARTIFACT.sub("", text).strip()
 
         return text
 
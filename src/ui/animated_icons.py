@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-from __future__ import annotations
-
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtProperty
-from PyQt6.QtGui import QPainter, QColor, QPen, QBrush
+from PyQt6.QtCore import Qt, QRect, QPropertyAnimation, QVariantAnimation, QEasingCurve, pyqtProperty
+from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QPixmap
 from PyQt6.QtWidgets import QWidget
 
 
@@ -15,6 +13,14 @@ class RecordingIcon(QWidget):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._radius_multiplier = 1.0
+        # Троттлинг перерисовок: анимация тикает с частотой дисплея, но
+        # большинство тиков двигают радиус на доли пикселя. Перерисовываем
+        # только когда целочисленный радиус в пикселях реально изменился.
+        self._base_radius_px = 0.0
+        self._last_radius_px = -1
+        # Bounding box максимального эллипса: инвалидируем только его,
+        # а не весь виджет — Qt склеивает такие rect'ы за цикл событий
+        self._draw_rect = QRect()
 
         self.animation = QPropertyAnimation(self, b"radiusMultiplier")
         self.animation.setDuration(800)
@@ -24,6 +30,18 @@ class RecordingIcon(QWidget):
         self.animation.setLoopCount(-1)
         self.animation.start()
 
+    def hideEvent(self, event) -> None:
+        # Скрытая иконка не должна тратить CPU на анимацию:
+        # Qt шлёт hide/show и при переключении страниц стека.
+        if self.animation.state() == QPropertyAnimation.State.Running:
+            self.animation.pause()
+        super().hideEvent(event)
+
+    def showEvent(self, event) -> None:
+        if self.animation.state() == QPropertyAnimation.State.Paused:
+            self.animation.resume()
+        super().showEvent(event)
+
     @pyqtProperty(float)
     def radiusMultiplier(self) -> float:
         return self._radius_multiplier
@@ -31,9 +49,30 @@ class RecordingIcon(QWidget):
     @radiusMultiplier.setter
     def radiusMultiplier(self, value: float) -> None:
         self._radius_multiplier = value
-        self.update()
+        new_radius_px = int(self._base_radius_px * value)
+        if new_radius_px != self._last_radius_px:
+            self._last_radius_px = new_radius_px
+            if self._draw_rect.isNull():
+                self.update()
+            else:
+                self.update(self._draw_rect)
+
+    def resizeEvent(self, event) -> None:
+        self._base_radius_px = min(self.width(), self.height()) / 2 * 0.6
+        self._last_radius_px = -1  # форсируем перерисовку под новый размер
+        max_radius = int(self._base_radius_px) + 1
+        center_x, center_y = self.width() // 2, self.height() // 2
+        self._draw_rect = QRect(
+            center_x - max_radius, center_y - max_radius, 2 * max_radius, 2 * max_radius
+        )
+        super().resizeEvent(event)
 
     def paintEvent(self, event) -> None:
+        # Частичная перерисовка, не задевающая иконку (Qt склеивает
+        # update-регионы соседних виджетов) — антиалиасный эллипс не рисуем
+        if not event.region().intersects(self.rect()):
+            return
+
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
@@ -54,15 +93,39 @@ class ProcessingIcon(QWidget):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._angle = 0
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._update_angle)
-        self.timer.start(30)  # ~33 FPS
-
-    def _update_angle(self) -> None:
-        self._angle = (self._angle + 10) % 360
-        self.update()
+        # QVariantAnimation вместо QTimer: тики интегрированы в
+        # анимационный каркас Qt, а не дергают питоновский колбэк
+        # безусловно каждые 30 мс
+        self._anim = QVariantAnimation(self)
+        self._anim.setStartValue(0)
+        self._anim.setEndValue(360)
+        self._anim.setDuration(1080)  # тот же темп: 360° за ~1.1 с
+        self._anim.setLoopCount(-1)
+        self._anim.valueChanged.connect(self._set_angle)
+        self._anim.start()
+
+    def hideEvent(self, event) -> None:
+        # Ставим анимацию на паузу, пока спиннер не виден
+        if self._anim.state() == QVariantAnimation.State.Running:
+            self._anim.pause()
+        super().hideEvent(event)
+
+    def showEvent(self, event) -> None:
+        if self._anim.state() == QVariantAnimation.State.Paused:
+            self._anim.resume()
+        super().showEvent(event)
+
+    def _set_angle(self, value) -> None:
+        angle = int(value) % 360
+        if angle != self._angle:
+            self._angle = angle
+            self.update()
 
     def paintEvent(self, event) -> None:
+        # Как и у RecordingIcon: чужой update-регион — дугу не рисуем
+        if not event.region().intersects(self.rect()):
+            return
+
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
@@ -89,10 +152,32 @@ class ProcessingIcon(QWidget):
 class ReadyIcon(QWidget):
     """
     Статичная иконка готовности — зеленая галочка.
+
+    Галочка не меняется между кадрами, поэтому растеризуется один раз
+    в QPixmap, а paintEvent только блитит кэш: антиалиасные линии не
+    перерисовываются на каждое перекрытие/раскрытие окна.
     """
 
-    def paintEvent(self, event) -> None:
-        painter = QPainter(self)
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._cache: QPixmap | None = None
+
+    def resizeEvent(self, event) -> None:
+        self._cache = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event) -> None:
+        # Смена палитры/стиля может поменять отрисовку — кэш устарел
+        self._cache = None
+        super().changeEvent(event)
+
+    def _render_cache(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         center_x, center_y = self.width() / 2, self.height() / 2
@@ -112,3 +197,10 @@ class ReadyIcon(QWidget):
             p1 = points[i]
             p2 = points[i+1]
             painter.drawLine(int(p1[0]), int(p1[1]), int(p2[0]), int(p2[1]))
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event) -> None:
+        if self._cache is None:
+            self._cache = self._render_cache()
+        QPainter(self).drawPixmap(0, 0, self._cache)
@@ -4,12 +4,13 @@ from pathlib import Path
 from typing import Optional
 
 from PyQt6.QtCore import QPoint, Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QMouseEvent, QGuiApplication
+from PyQt6.QtGui import QAction, QGuiApplication, QMouseEvent
 from PyQt6.QtWidgets import (
     QLabel,
     QHBoxLayout,
     QVBoxLayout,
     QWidget,
+    QPlainTextEdit,
     QPushButton,
     QStackedLayout,
     QComboBox,
@@ -22,7 +23,6 @@ from PyQt6.QtWidgets import (
     QMenu,
 )
 
-from PyQt6.QtGui import QMouseEvent, QGuiApplication, QAction
 from config.settings import UIConfig
 from ui.animated_icons import RecordingIcon, ProcessingIcon, ReadyIcon
 
@@ -122,6 +122,44 @@ class ClickableLabel(QLabel):
         super().mousePressEvent(event)
 
 
+class ClickableReadOnlyEdit(QPlainTextEdit):
+    """
+    Read-only блок текста на базе QPlainTextEdit.
+
+    QLabel с wordWrap перелэйаутит весь текст на каждый setText, что
+    заметно тормозит на длинных транскриптах. QPlainTextEdit использует
+    построчный layout и не имеет этой проблемы.
+
+    Для совместимости с QLabel-кодом (main.py использует result_label.setText)
+    предоставляет методы text()/setText().
+    """
+
+    clicked = pyqtSignal()
+
+    def __init__(self, text: str = "", parent=None) -> None:
+        super().__init__(text, parent)
+        self.setReadOnly(True)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        # Ограничиваем количество блоков, чтобы документ не рос бесконечно
+        self.setMaximumBlockCount(200)
+        self.setMaximumHeight(120)
+
+    # --- QLabel-совместимый API ---
+
+    def text(self) -> str:
+        return self.toPlainText()
+
+    def setText(self, text: str) -> None:
+        self.setPlainText(text or "")
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.clicked.emit()
+        super().mousePressEvent(event)
+
+
 class FloatingWindow(QWidget):
     """
     Главное плавающее окно VoiceCapture.
@@ -149,6 +187,8 @@ class FloatingWindow(QWidget):
 
         self._ui_config = ui_config
         self.history_manager = history_manager
+        # Кэшируем хэндл буфера обмена: не ходим в C++ на каждый клик
+        self._clipboard = QGuiApplication.clipboard()
         self._drag_position: Optional[QPoint] = None
         self._state: str = "idle"
         self._compact: bool = False
@@ -158,6 +198,32 @@ class FloatingWindow(QWidget):
         # режимы содержимого: "main" (основной) / "settings" (панель настроек)
         self._content_mode: str = "main"
 
+        # Коалесценция быстрых обновлений текста (частичные результаты Whisper):
+        # вместо setText на каждый вызов копим последнее значение и применяем
+        # его одним таймером, чтобы не перелэйаутить QLabel на каждый кадр.
+        self._pending_raw: Optional[str] = None
+        self._pending_processed: Optional[str] = None
+        # Кэш последних применённых значений: дешёвое сравнение строк
+        # вместо лишнего setText (relayout + пересчёт стилей) при том же тексте.
+        self._last_raw: str = ""
+        self._last_processed: str = ""
+        self._last_status: Optional[tuple[str, str]] = None
+        # Кэш фактически применённой видимости блоков / режима окна
+        self._text_blocks_visible: Optional[tuple[bool, bool]] = None
+        self._applied_compact: Optional[bool] = None
+        self._text_flush_timer = QTimer(self)
+        self._text_flush_timer.setSingleShot(True)
+        self._text_flush_timer.setInterval(40)
+        self._text_flush_timer.timeout.connect(self._flush_text)
+
+        # Перетаскивание окна: move() на каждое событие мыши заваливает
+        # композитор WM-геометрией при высоком polling rate. Копим целевую
+        # позицию и применяем её таймером ~60 Гц.
+        self._drag_target: Optional[QPoint] = None
+        self._drag_timer = QTimer(self)
+        self._drag_timer.setInterval(16)
+        self._drag_timer.timeout.connect(self._apply_drag_move)
+
         self._init_window_flags()
         self._init_ui()
         self._load_icons()
@@ -195,17 +261,19 @@ class FloatingWindow(QWidget):
         top_layout.addWidget(self.compact_button_normal)
         top_layout.addWidget(self.close_button)
 
-        status_container = QWidget()
-        status_layout = QHBoxLayout(status_container)
+        # Статусная строка — просто вложенный layout, без промежуточного
+        # QWidget-контейнера: меньше узлов в дереве layout'а.
+        status_layout = QHBoxLayout()
         status_layout.setContentsMargins(0, 0, 0, 0)
         status_layout.setSpacing(10)
+        status_layout.addStretch()
         status_layout.addWidget(self.icons_container)
         status_layout.addWidget(self.status_text_label)
         status_layout.addStretch()
         status_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         normal_layout.addLayout(top_layout)
-        normal_layout.addWidget(status_container, alignment=Qt.AlignmentFlag.AlignCenter)
+        normal_layout.addLayout(status_layout)
         normal_layout.addWidget(self.retry_button, alignment=Qt.AlignmentFlag.AlignCenter)
         normal_layout.addWidget(self.raw_label)
         normal_layout.addWidget(self.processed_label)
@@ -225,13 +293,16 @@ class FloatingWindow(QWidget):
         compact_layout.addStretch()
         compact_layout.addWidget(self.compact_button_compact)
 
-        # --- Основной стек и контейнер ---
-        self._stack = QStackedLayout()
-        self._stack.addWidget(self.normal_page)
-        self._stack.addWidget(self.compact_page)
-
+        # --- Основной контейнер ---
+        # Две взаимоисключающие страницы переключаются через setVisible:
+        # QStackedLayout здесь избыточен и добавляет лишний пересчёт геометрии
+        # на каждом setCurrentIndex.
         container = QWidget()
-        container.setLayout(self._stack)
+        pages_layout = QVBoxLayout(container)
+        pages_layout.setContentsMargins(0, 0, 0, 0)
+        pages_layout.addWidget(self.normal_page)
+        pages_layout.addWidget(self.compact_page)
+        self.compact_page.setVisible(False)
         container.setObjectName("container")
 
         root_layout = QVBoxLayout(self)
@@ -294,16 +365,18 @@ class FloatingWindow(QWidget):
         self.retry_button.hide()
 
         # --- Иконки состояний ---
+        # Статичные emoji растеризуем в QPixmap один раз: repaint становится
+        # блитом, без шейпинга emoji-шрифта на каждый кадр.
         self.icons_stack = QStackedLayout()
-        self.icon_idle = QLabel("🎙️")
+        self.icon_idle = QLabel()
         self.icon_idle.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.icon_idle.setStyleSheet("font-size: 24pt; color: rgba(255, 255, 255, 0.5);")
+        self.icon_idle.setPixmap(self._emoji_to_pixmap("🎙️", 24))
         self.icon_recording = RecordingIcon()
         self.icon_processing = ProcessingIcon()
         self.icon_ready = ReadyIcon()
-        self.icon_error = QLabel("⚠️")
+        self.icon_error = QLabel()
         self.icon_error.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.icon_error.setStyleSheet("font-size: 24pt; color: #FF9500;")
+        self.icon_error.setPixmap(self._emoji_to_pixmap("⚠️", 24))
 
         for icon in [self.icon_idle, self.icon_recording, self.icon_processing, self.icon_ready, self.icon_error]:
             self.icons_stack.addWidget(icon)
@@ -320,9 +393,14 @@ class FloatingWindow(QWidget):
             # Это упрощение; в сложном случае потребовалось бы более аккуратное клонирование.
             widget = self.icons_stack.widget(i)
             if isinstance(widget, QLabel):
-                new_label = QLabel(widget.text())
+                new_label = QLabel()
                 new_label.setAlignment(widget.alignment())
-                new_label.setStyleSheet(widget.styleSheet())
+                pixmap = widget.pixmap()
+                if pixmap is not None and not pixmap.isNull():
+                    new_label.setPixmap(pixmap)
+                else:
+                    new_label.setText(widget.text())
+                    new_label.setStyleSheet(widget.styleSheet())
                 self.icons_stack_compact.addWidget(new_label)
             elif isinstance(widget, RecordingIcon):
                 self.icons_stack_compact.addWidget(RecordingIcon())
@@ -336,17 +414,13 @@ class FloatingWindow(QWidget):
         self.icons_container_compact.setFixedSize(40, 40)
 
         # --- Текстовые поля ---
-        self.raw_label = ClickableLabel("")
-        self.raw_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        self.raw_label.setWordWrap(True)
+        self.raw_label = ClickableReadOnlyEdit("")
         self.raw_label.setObjectName("textBlock")
-        self.raw_label.clicked.connect(lambda: self._copy_text(self.raw_label.text()))
+        self.raw_label.clicked.connect(self._copy_raw)
 
-        self.processed_label = ClickableLabel("")
-        self.processed_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        self.processed_label.setWordWrap(True)
+        self.processed_label = ClickableReadOnlyEdit("")
         self.processed_label.setObjectName("textBlock")
-        self.processed_label.clicked.connect(lambda: self._copy_text(self.processed_label.text()))
+        self.processed_label.clicked.connect(self._copy_processed)
         self.result_label = self.processed_label
 
         # --- Список идей ---
@@ -422,6 +496,37 @@ class FloatingWindow(QWidget):
         self.status_text_label_compact.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
         self.status_text_label_compact.setStyleSheet(self.status_text_label.styleSheet())
 
+        # Карта состояний строится один раз: не пересоздаём dict и не ищем
+        # индекс иконки через indexOf на каждом set_state.
+        self._state_map = {
+            "idle": (self.icon_idle, ""),
+            "recording": (self.icon_recording, "Запись..."),
+            "processing": (self.icon_processing, "Обработка..."),
+            "ready": (self.icon_ready, "Готово"),
+            "error": (self.icon_error, "Ошибка"),
+        }
+        self._state_index = {
+            state: self.icons_stack.indexOf(icon)
+            for state, (icon, _) in self._state_map.items()
+        }
+
+    @staticmethod
+    def _emoji_to_pixmap(emoji: str, point_size: int, size: int = 40):
+        """Однократно растеризует emoji в QPixmap нужного размера."""
+        from PyQt6.QtGui import QColor, QFont, QPainter, QPixmap
+
+        pixmap = QPixmap(size, size)
+        pixmap.fill(QColor(0, 0, 0, 0))
+
+        painter = QPainter(pixmap)
+        font = QFont()
+        font.setPointSize(point_size)
+        painter.setFont(font)
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, emoji)
+        painter.end()
+
+        return pixmap
+
     def _apply_styles(self) -> None:
         self.setStyleSheet(
             """
@@ -433,8 +538,10 @@ class FloatingWindow(QWidget):
                 color: white;
                 font-size: 10pt;
             }
-            QLabel#textBlock {
+            #textBlock {
                 background-color: rgba(255, 255, 255, 0.08);
+                color: white;
+                font-size: 10pt;
                 border: 1px solid rgba(255, 255, 255, 0.15);
                 border-radius: 8px;
                 padding: 8px 10px;
@@ -490,46 +597,50 @@ class FloatingWindow(QWidget):
     # ------------------------------------------------------------------ state / mode
 
     def set_state(self, state: str) -> None:
+        # Повторный вызов с тем же состоянием — ничего не делаем.
+        # Исключение: после временных сообщений (show_message/_copy_text)
+        # кэш статуса сброшен в None, и set_state должен восстановить текст.
+        if self._state == state and self._last_status is not None:
+            return
         self._state = state
 
         # Обновляем оба стека иконок и текстовые метки
-        state_map = {
-            "idle": (self.icon_idle, ""),
-            "recording": (self.icon_recording, "Запись..."),
-            "processing": (self.icon_processing, "Обработка..."),
-            "ready": (self.icon_ready, "Готово"),
-            "error": (self.icon_error, "Ошибка"),
-        }
-        
-        target_icon, status_text = state_map.get(state, (self.icon_idle, ""))
+        target_icon, status_text = self._state_map.get(state, self._state_map["idle"])
 
-        # Находим индекс целевой иконки в основном стеке
-        target_index = self.icons_stack.indexOf(target_icon)
+        target_index = self._state_index.get(state, self._state_index["idle"])
         if target_index != -1:
             self.icons_stack.setCurrentIndex(target_index)
             # Синхронизируем компактный стек
             if self.icons_stack_compact.count() > target_index:
                 self.icons_stack_compact.setCurrentIndex(target_index)
 
-        self.status_text_label.setText(status_text)
-        self.status_text_label_compact.setText(status_text)
+        self._set_status_text(status_text)
 
         if state == "ready":
             QTimer.singleShot(1000, lambda: self.set_state("idle"))
-        
+
         if state != "error":
             self.hide_retry_button()
 
         # управляем отображением текстовых блоков
         self._text_blocks_enabled = state not in {"recording"}
         if state == "recording":
-            self.raw_label.setText("")
-            self.processed_label.setText("")
+            self.set_raw_text("")
+            self.set_processed_text("")
         self._refresh_text_block_visibility()
 
-        # Если мы в компактном режиме, нужно обновить размер, т.к. текст мог измениться
-        if self._compact:
-            self.adjustSize()
+        # В компактном режиме размер жёстко задан в _apply_compact_mode
+        # (setFixedSize), поэтому adjustSize здесь не нужен — он лишь
+        # заставлял Qt пересчитывать sizeHint всех детей на каждый set_state.
+
+    def _set_status_text(self, text: str, compact_text: Optional[str] = None) -> None:
+        """Обновляет статусные метки только если текст реально изменился."""
+        compact_text = text if compact_text is None else compact_text
+        if self._last_status == (text, compact_text):
+            return
+        self._last_status = (text, compact_text)
+        self.status_text_label.setText(text)
+        self.status_text_label_compact.setText(compact_text)
 
     def set_compact(self, compact: bool) -> None:
         """Переключение между большим окном и компактным микрофоном."""
@@ -555,19 +666,32 @@ class FloatingWindow(QWidget):
         # Теперь видимость зависит от состояния и флага постпроцессинга
         should_show_raw = self._text_blocks_enabled
         should_show_processed = self._text_blocks_enabled and self._postprocess_enabled
-        
-        self.raw_label.setVisible(should_show_raw)
-        self.processed_label.setVisible(should_show_processed)
+
+        # setVisible дёргает цепочку инвалидаций layout'а — зовём его,
+        # только если видимость реально меняется.
+        if self._text_blocks_visible != (should_show_raw, should_show_processed):
+            self._text_blocks_visible = (should_show_raw, should_show_processed)
+            # Для скрытых блоков отключаем и обновления: Qt не тратит время
+            # на разрешение QSS-правил textBlock, пока блок не виден.
+            self.raw_label.setUpdatesEnabled(should_show_raw)
+            self.raw_label.setVisible(should_show_raw)
+            self.processed_label.setUpdatesEnabled(should_show_processed)
+            self.processed_label.setVisible(should_show_processed)
 
     def _apply_compact_mode(self) -> None:
+        if self._applied_compact == self._compact:
+            return
+        self._applied_compact = self._compact
         if self._compact:
-            self._stack.setCurrentWidget(self.compact_page)
+            self.normal_page.setVisible(False)
+            self.compact_page.setVisible(True)
             # Задаём жёсткий размер для компактного режима, чтобы он не "прыгал".
             self.setFixedSize(220, 48)
             if hasattr(self, "size_grip"):
                 self.size_grip.hide()
         else:
-            self._stack.setCurrentWidget(self.normal_page)
+            self.compact_page.setVisible(False)
+            self.normal_page.setVisible(True)
             self._refresh_text_block_visibility()
             
             # Восстанавливаем исходный размер с отсрочкой.
@@ -582,14 +706,23 @@ class FloatingWindow(QWidget):
                 self.size_grip.show()
 
     def show_message(self, text: str, timeout_ms: int = 2000) -> None:
+        # прямой setText мимо _set_status_text — сбрасываем кэш статуса
+        self._last_status = None
         self.status_text_label.setText(text)
         if timeout_ms > 0:
             QTimer.singleShot(timeout_ms, lambda: self.set_state(self._state))
 
+    def _copy_raw(self) -> None:
+        self._copy_text(self.raw_label.text())
+
+    def _copy_processed(self) -> None:
+        self._copy_text(self.processed_label.text())
+
     def _copy_text(self, text: str) -> None:
         if not text:
             return
-        QGuiApplication.clipboard().setText(text)
+        self._clipboard.setText(text)
+        self._last_status = None
         self.status_text_label.setText("Скопировано в буфер обмена")
         QTimer.singleShot(1200, lambda: self.set_state(self._state))
 
@@ -605,11 +738,28 @@ class FloatingWindow(QWidget):
 
     def set_raw_text(self, text: str) -> None:
         """Показать сырой текст от Whisper (верхний блок)."""
-        self.raw_label.setText(text or "")
+        self._pending_raw = text or ""
+        if not self._text_flush_timer.isActive():
+            self._text_flush_timer.start()
 
     def set_processed_text(self, text: str) -> None:
         """Показать текст после постпроцессинга (нижний блок)."""
-        self.processed_label.setText(text or "")
+        self._pending_processed = text or ""
+        if not self._text_flush_timer.isActive():
+            self._text_flush_timer.start()
+
+    def _flush_text(self) -> None:
+        """Применяет накопленные обновления текста одним проходом таймера."""
+        if self._pending_raw is not None:
+            if self._pending_raw != self._last_raw:
+                self._last_raw = self._pending_raw
+                self.raw_label.setText(self._pending_raw)
+            self._pending_raw = None
+        if self._pending_processed is not None:
+            if self._pending_processed != self._last_processed:
+                self._last_processed = self._pending_processed
+                self.processed_label.setText(self._pending_processed)
+            self._pending_processed = None
 
     def add_idea(self, text: str) -> None:
         """Добавить новую идею в список. Если webhook mode — ничего не добавляем."""
@@ -632,11 +782,9 @@ class FloatingWindow(QWidget):
     def show_idea_recording_status(self, webhook_mode: bool = False) -> None:
         """Показать статус записи идеи (или webhook-записи)."""
         if webhook_mode:
-            self.status_text_label.setText("Запись → N8N Webhook...")
-            self.status_text_label_compact.setText("Запись → N8N...")
+            self._set_status_text("Запись → N8N Webhook...", "Запись → N8N...")
         else:
-            self.status_text_label.setText("Запись идеи...")
-            self.status_text_label_compact.setText("Запись идеи...")
+            self._set_status_text("Запись идеи...")
 
     def set_webhook_mode(self, enabled: bool) -> None:
         """Включить/выключить режим webhook (скрывает список идей)."""
@@ -719,11 +867,20 @@ class FloatingWindow(QWidget):
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         if event.buttons() & Qt.MouseButton.LeftButton and self._drag_position is not None:
-            self.move(event.globalPosition().toPoint() - self._drag_position)
+            self._drag_target = event.globalPosition().toPoint() - self._drag_position
+            if not self._drag_timer.isActive():
+                self._drag_timer.start()
             event.accept()
         super().mouseMoveEvent(event)
 
+    def _apply_drag_move(self) -> None:
+        if self._drag_target is not None:
+            self.move(self._drag_target)
+            self._drag_target = None
+
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        self._drag_timer.stop()
+        self._apply_drag_move()
         self._drag_position = None
         super().mouseReleaseEvent(event)
 
@@ -1,152 +1,328 @@
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QGuiApplication
+from functools import partial
+
+from PyQt6.QtCore import (
+    Qt,
+    QAbstractListModel,
+    QEvent,
+    QMimeData,
+    QModelIndex,
+    QRect,
+    QSize,
+)
+from PyQt6.QtGui import (
+    QClipboard,
+    QColor,
+    QFont,
+    QGuiApplication,
+    QPainter,
+    QPalette,
+    QStaticText,
+    QTextOption,
+)
 from PyQt6.QtWidgets import (
+    QApplication,
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
-    QScrollArea,
-    QWidget,
+    QListView,
+    QMenu,
     QPushButton,
-    QFrame,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionButton,
 )
 
-class HistoryItemWidget(QFrame):
+
+# Цвет и шрифт заголовков задаём через QPalette/QFont, а не через QSS:
+# это минует CSS-движок стилей Qt (парсинг + каскад) — присваивается
+# готовый объект. Строятся один раз на модуль.
+_TITLE_FONT = QFont()
+_TITLE_FONT.setPointSize(16)
+_TITLE_FONT.setBold(True)
+
+_TITLE_PALETTE = QPalette()
+_TITLE_PALETTE.setColor(QPalette.ColorRole.WindowText, QColor("white"))
+
+_EMPTY_FONT = QFont()
+_EMPTY_FONT.setPointSize(12)
+
+_EMPTY_PALETTE = QPalette()
+_EMPTY_PALETTE.setColor(QPalette.ColorRole.WindowText, QColor(255, 255, 255, 76))
+
+
+def _set_clipboard_text(text: str) -> None:
+    """
+    Кладёт текст в буфер обмена через готовый QMimeData.
+
+    clipboard().setText() каждый раз синтезирует QMimeData внутри Qt;
+    здесь объект собирается один раз и передаётся владельцу напрямую.
     """
-    Виджет для одной записи истории.
-    Показывает время, сырой текст и обработанный текст.
+    md = QMimeData()
+    md.setText(text)
+    QGuiApplication.clipboard().setMimeData(md, QClipboard.Mode.Clipboard)
+
+
+class HistoryListModel(QAbstractListModel):
+    """
+    Модель истории распознаваний поверх HistoryManager.
+
+    Отдаёт timestamp / raw_text / processed_text через кастомные роли,
+    чтобы делегат рисовал только видимые строки.
     """
-    copy_requested = pyqtSignal(str)
 
-    def __init__(self, item: dict, parent=None):
+    TimestampRole = Qt.ItemDataRole.UserRole + 1
+    RawTextRole = Qt.ItemDataRole.UserRole + 2
+    ProcessedTextRole = Qt.ItemDataRole.UserRole + 3
+
+    def __init__(self, history_manager, parent=None):
         super().__init__(parent)
-        self.item = item
-        self._init_ui()
+        self.history_manager = history_manager
+        self._items = history_manager.get_items()
 
-    def _init_ui(self):
-        self.setFrameShape(QFrame.Shape.StyledPanel)
-        self.setStyleSheet("""
-            HistoryItemWidget {
-                background-color: rgba(255, 255, 255, 0.05);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 8px;
-            }
-            HistoryItemWidget:hover {
-                background-color: rgba(255, 255, 255, 0.08);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-            }
-        """)
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._items)
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(12, 12, 12, 12)
-        layout.setSpacing(8)
-
-        # Header: Timestamp
-        header_layout = QHBoxLayout()
-        time_label = QLabel(self.item.get("timestamp", ""))
-        time_label.setStyleSheet("color: rgba(255, 255, 255, 0.5); font-size: 9pt;")
-        header_layout.addWidget(time_label)
-        header_layout.addStretch()
-        layout.addLayout(header_layout)
-
-        # Content area
-        content_layout = QHBoxLayout()
-        content_layout.setSpacing(15)
-
-        # Raw Text (Left)
-        raw_container = QWidget()
-        raw_layout = QVBoxLayout(raw_container)
-        raw_layout.setContentsMargins(0, 0, 0, 0)
-        raw_layout.setSpacing(4)
-        
-        raw_title = QLabel("Исходный:")
-        raw_title.setStyleSheet("color: rgba(255, 255, 255, 0.4); font-size: 9pt; font-weight: bold;")
-        
-        self.raw_text = QLabel(self.item.get("raw_text", ""))
-        self.raw_text.setWordWrap(True)
-        self.raw_text.setStyleSheet("color: rgba(255, 255, 255, 0.7); font-size: 10pt;")
-        self.raw_text.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-        
-        raw_layout.addWidget(raw_title)
-        raw_layout.addWidget(self.raw_text)
-        raw_layout.addStretch()
-
-        # Processed Text (Right)
-        proc_container = QWidget()
-        proc_layout = QVBoxLayout(proc_container)
-        proc_layout.setContentsMargins(0, 0, 0, 0)
-        proc_layout.setSpacing(4)
-        
-        proc_title = QLabel("Обработанный:")
-        proc_title.setStyleSheet("color: #00bcd4; font-size: 9pt; font-weight: bold;")
-        
-        self.proc_text = QLabel(self.item.get("processed_text", ""))
-        self.proc_text.setWordWrap(True)
-        self.proc_text.setStyleSheet("color: white; font-size: 10pt; font-weight: bold;")
-        self.proc_text.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-        
-        proc_layout.addWidget(proc_title)
-        proc_layout.addWidget(self.proc_text)
-        proc_layout.addStretch()
-
-        # Add to content layout (50% width each)
-        content_layout.addWidget(raw_container, 1)
-        
-        # Separator
-        line = QFrame()
-        line.setFrameShape(QFrame.Shape.VLine)
-        line.setFrameShadow(QFrame.Shadow.Sunken)
-        line.setStyleSheet("background-color: rgba(255, 255, 255, 0.1);")
-        content_layout.addWidget(line)
-        
-        content_layout.addWidget(proc_container, 1)
-        
-        layout.addLayout(content_layout)
-
-        # Actions
-        actions_layout = QHBoxLayout()
-        actions_layout.addStretch()
-        
-        copy_raw_btn = QPushButton("Копировать исходный")
-        copy_raw_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        copy_raw_btn.setStyleSheet("""
-            QPushButton {
-                color: rgba(255, 255, 255, 0.6);
-                background: transparent;
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 9pt;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.1);
-                color: white;
-            }
-        """)
-        copy_raw_btn.clicked.connect(lambda: self.copy_requested.emit(self.item.get("raw_text", "")))
-        
-        copy_proc_btn = QPushButton("Копировать результат")
-        copy_proc_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        copy_proc_btn.setStyleSheet("""
-            QPushButton {
-                color: white;
-                background-color: #007bff;
-                border: none;
-                border-radius: 4px;
-                padding: 4px 12px;
-                font-size: 9pt;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-        """)
-        copy_proc_btn.clicked.connect(lambda: self.copy_requested.emit(self.item.get("processed_text", "")))
-        
-        actions_layout.addWidget(copy_raw_btn)
-        actions_layout.addWidget(copy_proc_btn)
-        
-        layout.addLayout(actions_layout)
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._items)):
+            return None
+        item = self._items[index.row()]
+        if role == self.TimestampRole:
+            return item.get("timestamp", "")
+        if role == self.RawTextRole:
+            return item.get("raw_text", "")
+        if role in (self.ProcessedTextRole, Qt.ItemDataRole.DisplayRole):
+            return item.get("processed_text", "")
+        return None
+
+    def refresh(self):
+        """Перечитать записи из HistoryManager одним сбросом модели."""
+        self.beginResetModel()
+        self._items = self.history_manager.get_items()
+        self.endResetModel()
+
+    def clear(self):
+        """
+        Очистить модель без похода в HistoryManager: после clear() менеджера
+        мы уже знаем, что список пуст — повторный get_items() не нужен.
+        """
+        self.beginResetModel()
+        self._items = []
+        self.endResetModel()
+
+
+class HistoryItemDelegate(QStyledItemDelegate):
+    """
+    Рисует одну запись истории напрямую через QPainter.
+
+    Вместо QFrame с десятком дочерних QLabel/QPushButton на каждую запись
+    (O(N) виджетов и парсингов стилей при открытии диалога) view создаёт
+    ноль виджетов — отрисовываются только видимые строки.
+    """
+
+    ROW_HEIGHT = 132
+    PADDING = 12
+    COLUMN_GAP = 15
+    # Длинные транскрипты обрезаем до видимого превью: полный текст
+    # остаётся в истории и копируется целиком через контекстное меню.
+    MAX_PREVIEW_CHARS = 400
+    # Кнопки "Копировать" рисуются стилем (CE_PushButton), клики ловит
+    # editorEvent — ни одного реального QPushButton на запись не создаётся.
+    BTN_W = 96
+    BTN_H = 20
+
+    # Цвета как константы класса: не аллоцируем QColor на каждый paint
+    BG_COLOR = QColor(255, 255, 255, 13)
+    BG_HOVER_COLOR = QColor(255, 255, 255, 20)
+    TIME_COLOR = QColor(255, 255, 255, 127)
+    SEPARATOR_COLOR = QColor(255, 255, 255, 25)
+    RAW_TITLE_COLOR = QColor(255, 255, 255, 102)
+    RAW_TEXT_COLOR = QColor(255, 255, 255, 178)
+    PROC_TITLE_COLOR = QColor("#00bcd4")
+    PROC_TEXT_COLOR = QColor("white")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Шрифты строим один раз на делегат, а не на каждую отрисовку строки
+        self._small_font = QFont()
+        self._small_font.setPointSize(9)
+        self._title_font = QFont(self._small_font)
+        self._title_font.setBold(True)
+        self._text_font = QFont()
+        self._text_font.setPointSize(10)
+        self._proc_font = QFont(self._text_font)
+        self._proc_font.setBold(True)
+        # QStaticText кэширует layout глифов между отрисовками — текст
+        # не перешейпливается на каждый repaint при прокрутке/hover.
+        self._static_cache: dict = {}
+        # (row, "raw"|"proc") нажатой кнопки копирования, если есть
+        self._pressed = None
+
+    def _preview(self, text: str) -> str:
+        if len(text) <= self.MAX_PREVIEW_CHARS:
+            return text
+        return text[: self.MAX_PREVIEW_CHARS - 3] + "…"
+
+    def _static_text(self, text: str, width: int, font_tag: str) -> QStaticText:
+        key = (font_tag, width, text)
+        cached = self._static_cache.get(key)
+        if cached is None:
+            # Простая защита от неограниченного роста кэша
+            if len(self._static_cache) > 256:
+                self._static_cache.clear()
+            cached = QStaticText(text)
+            option = QTextOption()
+            option.setWrapMode(QTextOption.WrapMode.WrapAtWordBoundaryOrAnywhere)
+            cached.setTextOption(option)
+            cached.setTextWidth(width)
+            self._static_cache[key] = cached
+        return cached
+
+    def _button_rects(self, option_rect) -> tuple[QRect, QRect]:
+        """Области кнопок копирования (исходный/обработанный) в строке."""
+        rect = option_rect.adjusted(0, 5, 0, -5)
+        inner = rect.adjusted(
+            self.PADDING, self.PADDING, -self.PADDING, -self.PADDING
+        )
+        col_w = (inner.width() - self.COLUMN_GAP) // 2
+        raw_btn = QRect(
+            inner.left() + col_w - self.BTN_W, inner.top(), self.BTN_W, self.BTN_H
+        )
+        proc_btn = QRect(
+            inner.right() - self.BTN_W, inner.top(), self.BTN_W, self.BTN_H
+        )
+        return raw_btn, proc_btn
+
+    def sizeHint(self, option, index):
+        # Фиксированная высота строки: view может не вычислять layout
+        # невидимых записей.
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        rect = option.rect.adjusted(0, 5, 0, -5)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+
+        # Фон карточки (как у прежнего HistoryItemWidget)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.BG_HOVER_COLOR if hovered else self.BG_COLOR)
+        painter.drawRoundedRect(rect, 8, 8)
+
+        inner = rect.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+
+        # Header: timestamp
+        painter.setFont(self._small_font)
+        painter.setPen(self.TIME_COLOR)
+        timestamp = index.data(HistoryListModel.TimestampRole) or ""
+        painter.drawText(
+            inner,
+            Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft,
+            timestamp,
+        )
+
+        # Кнопки копирования: стилевая отрисовка вместо настоящих
+        # QPushButton — view не держит 2N виджетов ради редких кликов.
+        style = option.widget.style() if option.widget else QApplication.style()
+        for which, btn_rect in zip(("raw", "proc"), self._button_rects(option.rect)):
+            btn_opt = QStyleOptionButton()
+            btn_opt.rect = btn_rect
+            btn_opt.text = "Копировать"
+            btn_opt.state = QStyle.StateFlag.State_Enabled
+            if self._pressed == (index.row(), which):
+                btn_opt.state |= QStyle.StateFlag.State_Sunken
+            else:
+                btn_opt.state |= QStyle.StateFlag.State_Raised
+            style.drawControl(
+                QStyle.ControlElement.CE_PushButton, btn_opt, painter, option.widget
+            )
+
+        # Две колонки: исходный слева, обработанный справа
+        header_h = 20
+        col_w = (inner.width() - self.COLUMN_GAP) // 2
+        raw_rect = QRect(
+            inner.left(), inner.top() + header_h, col_w, inner.height() - header_h
+        )
+        proc_rect = QRect(
+            inner.left() + col_w + self.COLUMN_GAP,
+            inner.top() + header_h,
+            col_w,
+            inner.height() - header_h,
+        )
+
+        # Разделитель между колонками
+        sep_x = inner.left() + col_w + self.COLUMN_GAP // 2
+        painter.setPen(self.SEPARATOR_COLOR)
+        painter.drawLine(sep_x, raw_rect.top(), sep_x, raw_rect.bottom())
+
+        title_h = 16
+        wrap = Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft
+
+        painter.setFont(self._title_font)
+        painter.setPen(self.RAW_TITLE_COLOR)
+        painter.drawText(raw_rect, wrap, "Исходный:")
+        painter.setPen(self.PROC_TITLE_COLOR)
+        painter.drawText(proc_rect, wrap, "Обработанный:")
+
+        raw_text_rect = raw_rect.adjusted(0, title_h, 0, 0)
+        proc_text_rect = proc_rect.adjusted(0, title_h, 0, 0)
+
+        raw_preview = self._preview(index.data(HistoryListModel.RawTextRole) or "")
+        proc_preview = self._preview(
+            index.data(HistoryListModel.ProcessedTextRole) or ""
+        )
+
+        painter.setFont(self._text_font)
+        painter.setPen(self.RAW_TEXT_COLOR)
+        painter.setClipRect(raw_text_rect)
+        painter.drawStaticText(
+            raw_text_rect.topLeft(),
+            self._static_text(raw_preview, raw_text_rect.width(), "raw"),
+        )
+        painter.setFont(self._proc_font)
+        painter.setPen(self.PROC_TEXT_COLOR)
+        painter.setClipRect(proc_text_rect)
+        painter.drawStaticText(
+            proc_text_rect.topLeft(),
+            self._static_text(proc_preview, proc_text_rect.width(), "proc"),
+        )
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        etype = event.type()
+        if etype in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease):
+            raw_btn, proc_btn = self._button_rects(option.rect)
+            pos = event.position().toPoint()
+            if raw_btn.contains(pos):
+                which = "raw"
+            elif proc_btn.contains(pos):
+                which = "proc"
+            else:
+                which = None
+
+            if etype == QEvent.Type.MouseButtonPress:
+                if which is not None:
+                    self._pressed = (index.row(), which)
+                    if option.widget is not None:
+                        option.widget.update(option.rect)
+                    return True
+            else:
+                pressed, self._pressed = self._pressed, None
+                if option.widget is not None:
+                    option.widget.update(option.rect)
+                if which is not None and pressed == (index.row(), which):
+                    role = (
+                        HistoryListModel.RawTextRole
+                        if which == "raw"
+                        else HistoryListModel.ProcessedTextRole
+                    )
+                    _set_clipboard_text(index.data(role) or "")
+                    return True
+        return super().editorEvent(event, model, option, index)
 
 
 class HistoryDialog(QDialog):
@@ -158,29 +334,9 @@ class HistoryDialog(QDialog):
         self._init_ui()
 
     def _init_ui(self):
-        # Dark theme style
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1e1e1e;
-            }
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background: #2b2b2b;
-                width: 10px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #555;
-                min-height: 20px;
-                border-radius: 5px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
+        # Тёмная тема приходит из общего стиля приложения (ui.theme)
+        # по objectName — локальный setStyleSheet больше не нужен.
+        self.setObjectName("historyDialog")
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -188,93 +344,92 @@ class HistoryDialog(QDialog):
 
         # Title
         title = QLabel("История распознаваний")
-        title.setStyleSheet("color: white; font-size: 16pt; font-weight: bold;")
+        title.setFont(_TITLE_FONT)
+        title.setPalette(_TITLE_PALETTE)
         layout.addWidget(title)
 
-        # Scroll Area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        
-        container = QWidget()
-        container.setStyleSheet("background: transparent;")
-        self.items_layout = QVBoxLayout(container)
-        self.items_layout.setSpacing(10)
-        self.items_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        
-        scroll.setWidget(container)
-        layout.addWidget(scroll)
-
-        # Load items
-        self._load_items()
+        # Виртуализированный список: создаётся ровно один QListView,
+        # записи рисует делегат — строки-виджеты больше не создаются.
+        self.model = HistoryListModel(self.history_manager, self)
+        self.delegate = HistoryItemDelegate(self)
+
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.setItemDelegate(self.delegate)
+        self.list_view.setUniformItemSizes(True)
+        # Ленивая раскладка: view размечает строки пачками по мере прокрутки,
+        # а не все записи при открытии диалога.
+        self.list_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.list_view.setBatchSize(20)
+        self.list_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.list_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.list_view.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover, True)
+        self.list_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.list_view.customContextMenuRequested.connect(self._show_context_menu)
+        layout.addWidget(self.list_view)
+
+        # Заглушка для пустой истории
+        self.empty_label = QLabel("История пуста")
+        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.empty_label.setFont(_EMPTY_FONT)
+        self.empty_label.setPalette(_EMPTY_PALETTE)
+        self.empty_label.setContentsMargins(0, 50, 0, 0)
+        layout.addWidget(self.empty_label)
+        self._update_empty_state()
 
         # Footer
         footer_layout = QHBoxLayout()
-        
+
         clear_btn = QPushButton("Очистить историю")
         clear_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                color: #ff4d4d;
-                background: transparent;
-                border: 1px solid #ff4d4d;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-size: 10pt;
-            }
-            QPushButton:hover {
-                background: rgba(255, 77, 77, 0.1);
-            }
-        """)
+        clear_btn.setObjectName("historyClearBtn")
         clear_btn.clicked.connect(self._clear_history)
-        
+
         close_btn = QPushButton("Закрыть")
         close_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                color: white;
-                background-color: #444;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 16px;
-                font-size: 10pt;
-            }
-            QPushButton:hover {
-                background-color: #555;
-            }
-        """)
+        close_btn.setObjectName("historyCloseBtn")
         close_btn.clicked.connect(self.accept)
-        
+
         footer_layout.addWidget(clear_btn)
         footer_layout.addStretch()
         footer_layout.addWidget(close_btn)
-        
+
         layout.addLayout(footer_layout)
 
-    def _load_items(self):
-        # Clear existing
-        while self.items_layout.count():
-            item = self.items_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        items = self.history_manager.get_items()
-        if not items:
-            empty_label = QLabel("История пуста")
-            empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            empty_label.setStyleSheet("color: rgba(255, 255, 255, 0.3); font-size: 12pt; margin-top: 50px;")
-            self.items_layout.addWidget(empty_label)
+    def _update_empty_state(self):
+        has_items = self.model.rowCount() > 0
+        self.list_view.setVisible(has_items)
+        self.empty_label.setVisible(not has_items)
+
+    def _show_context_menu(self, pos):
+        index = self.list_view.indexAt(pos)
+        if not index.isValid():
             return
 
-        for item in items:
-            widget = HistoryItemWidget(item)
-            widget.copy_requested.connect(self._copy_to_clipboard)
-            self.items_layout.addWidget(widget)
+        # Тексты читаем из модели один раз: обработчик не делает повторный
+        # index.data() на каждый клик, а partial не тащит за собой замыкание.
+        raw_text = index.data(HistoryListModel.RawTextRole) or ""
+        proc_text = index.data(HistoryListModel.ProcessedTextRole) or ""
+
+        menu = QMenu(self)
+        action_raw = menu.addAction("Копировать исходный")
+        action_raw.triggered.connect(partial(self._copy_to_clipboard, raw_text))
+        action_proc = menu.addAction("Копировать результат")
+        action_proc.triggered.connect(partial(self._copy_to_clipboard, proc_text))
+        menu.exec(self.list_view.viewport().mapToGlobal(pos))
 
     def _copy_to_clipboard(self, text):
-        QGuiApplication.clipboard().setText(text)
-        # Optional: Show toast or feedback? 
+        _set_clipboard_text(text)
+        # Optional: Show toast or feedback?
         # For now, just copy.
 
     def _clear_history(self):
         self.history_manager.clear()
-        self._load_items()
\ No newline at end of file
+        # Сброс модели и смена видимости — под выключенными обновлениями,
+        # чтобы view перерисовался один раз, а не на каждый шаг.
+        self.list_view.setUpdatesEnabled(False)
+        try:
+            self.model.clear()
+            self._update_empty_state()
+        finally:
+            self.list_view.setUpdatesEnabled(True)
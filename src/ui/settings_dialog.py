@@ -23,6 +23,43 @@ from loguru import logger
 from config.settings import AppSettings, RecognitionConfig, HotkeysConfig, IntegrationsConfig
 
 
+# Таблица "поле формы -> путь в настройках" для строковых QLineEdit.
+# Убирает дублирование парных setText()/.text() между формой и dataclass'ами:
+# загрузка и сбор значений идут одним циклом по таблице.
+_FIELD_MAP: tuple[tuple[str, str], ...] = (
+    ("groq_api_key_edit", "recognition.groq.api_key"),
+    ("openai_api_key_edit", "recognition.openai.api_key"),
+    ("openai_base_url_edit", "recognition.openai.base_url"),
+    ("record_hotkey_edit", "hotkeys.record"),
+    ("record_idea_hotkey_edit", "hotkeys.record_idea"),
+    ("groq_asr_model_edit", "recognition.groq.model"),
+    ("openai_asr_model_edit", "recognition.openai.model"),
+    ("groq_llm_model_edit", "recognition.groq.model_process"),
+    ("openai_llm_model_edit", "recognition.openai.model_process"),
+    ("n8n_webhook_edit", "integrations.n8n_webhook_url"),
+)
+
+
+# Допустимые значения backend'ов: frozenset даёт O(1) membership-тест,
+# а _norm сводит все fallback-ветки нормализации к одному месту.
+_KNOWN_BACKENDS = frozenset({"groq", "openai"})
+_KNOWN_LLM = frozenset({"groq", "openai"})
+
+
+def _norm(value: Optional[str], known: frozenset, default: str) -> str:
+    """Нормализует имя backend'а: casefold + проверка по известным значениям."""
+    value = (value or default).casefold()
+    return value if value in known else default
+
+
+def _resolve(settings: AppSettings, path: str) -> str:
+    """Достаёт строковое значение из настроек по точечному пути."""
+    obj = settings
+    for part in path.split("."):
+        obj = getattr(obj, part)
+    return obj or ""
+
+
 class SettingsDialog(QDialog):
     """
     Окно настроек распознавания и постобработки.
@@ -40,8 +77,17 @@ class SettingsDialog(QDialog):
         self._original_settings = settings
         self._result_settings: Optional[AppSettings] = None
 
-        self._init_ui()
-        self._load_from_settings(settings)
+        # Ленивая сборка: дерево виджетов (~20 полей + формы) строится
+        # при первом показе, а не в конструкторе — созданный, но так и
+        # не показанный диалог не стоит ничего.
+        self._ui_built = False
+
+    def showEvent(self, event) -> None:
+        if not self._ui_built:
+            self._init_ui()
+            self._load_from_settings(self._original_settings)
+            self._ui_built = True
+        super().showEvent(event)
 
     # ------------------------------------------------------------------ public API
 
@@ -51,63 +97,11 @@ class SettingsDialog(QDialog):
     # ------------------------------------------------------------------ UI
 
     def _init_ui(self) -> None:
-        layout = QVBoxLayout(self)
+        # Контрастная тёмная тема задаётся общим стилем приложения (ui.theme)
+        # через objectName — диалог больше не парсит собственный QSS.
+        self.setObjectName("settingsDialog")
 
-        # Сделать текст и подписи более контрастными
-        self.setStyleSheet(
-            """
-            QDialog {
-                background-color: #2b2b2b;
-                color: #f0f0f0;
-            }
-            QGroupBox {
-                color: #f0f0f0;
-                font-weight: bold;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                margin-top: 8px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 4px;
-            }
-            QLabel {
-                color: #f0f0f0;
-            }
-            QLineEdit {
-                background-color: #3a3a3a;
-                color: #ffffff;
-                border: 1px solid #666666;
-                border-radius: 3px;
-                padding: 2px 4px;
-            }
-            QLineEdit:disabled {
-                background-color: #444444;
-                color: #aaaaaa;
-            }
-            QCheckBox {
-                color: #f0f0f0;
-            }
-            QComboBox {
-                background-color: #3a3a3a;
-                color: #ffffff;
-                border: 1px solid #666666;
-                border-radius: 3px;
-                padding: 2px 4px;
-            }
-            QDialogButtonBox QPushButton {
-                min-width: 70px;
-            }
-            QPlainTextEdit {
-                background-color: #3a3a3a;
-                color: #ffffff;
-                border: 1px solid #666666;
-                border-radius: 3px;
-                padding: 2px 4px;
-            }
-            """
-        )
+        layout = QVBoxLayout(self)
 
         # === Блок: Аудио =======================================================
         audio_group = QGroupBox("Аудио")
@@ -129,7 +123,7 @@ class SettingsDialog(QDialog):
         
         from PyQt6.QtWidgets import QPushButton
         self.clear_recovery_btn = QPushButton("Очистить папку RECOVERY")
-        self.clear_recovery_btn.setStyleSheet("background-color: #4a2b2b; color: white; font-weight: bold;")
+        self.clear_recovery_btn.setObjectName("clearRecoveryBtn")
         self.clear_recovery_btn.clicked.connect(self._on_clear_recovery)
         cleanup_layout.addWidget(self.clear_recovery_btn)
         
@@ -145,6 +139,13 @@ class SettingsDialog(QDialog):
         # выбор сервиса распознавания ничего не скрывает, сигнал больше не нужен
         backend_form.addRow("Сервис распознавания:", self.backend_combo)
 
+        # Кэш индексов по userData: O(1) dict-lookup вместо findData-скана
+        # модели combo при каждом открытии настроек
+        self._backend_index = {
+            self.backend_combo.itemData(i): i
+            for i in range(self.backend_combo.count())
+        }
+
         self.groq_api_key_edit = QLineEdit()
         self.groq_api_key_edit.setEchoMode(QLineEdit.EchoMode.Password)
         backend_form.addRow("Groq API key:", self.groq_api_key_edit)
@@ -195,6 +196,11 @@ class SettingsDialog(QDialog):
         self.post_backend_combo.addItem("OpenAI", userData="openai")
         post_form.addRow("Сервис постпроцессинга:", self.post_backend_combo)
 
+        self._post_backend_index = {
+            self.post_backend_combo.itemData(i): i
+            for i in range(self.post_backend_combo.count())
+        }
+
         self.groq_llm_model_edit = QLineEdit()
         post_form.addRow("Groq postprocess model:", self.groq_llm_model_edit)
 
@@ -220,7 +226,7 @@ class SettingsDialog(QDialog):
             "Если заполнено — при записи идеи (Ctrl+Win+Alt) текст будет отправлен на этот Webhook."
         )
         hint_label.setWordWrap(True)
-        hint_label.setStyleSheet("color: #aaaaaa; font-size: 11px;")
+        hint_label.setObjectName("settingsHintLabel")
         integrations_form.addRow(hint_label)
 
         layout.addWidget(integrations_group)
@@ -264,17 +270,13 @@ class SettingsDialog(QDialog):
         rec: RecognitionConfig = settings.recognition
 
         # backend
-        backend = (rec.backend or "groq").lower()
-        index = self.backend_combo.findData(backend)
-        if index == -1:
-            index = self.backend_combo.findData("groq")
-        if index != -1:
-            self.backend_combo.setCurrentIndex(index)
-
-        # ключи / URL
-        self.groq_api_key_edit.setText(rec.groq.api_key)
-        self.openai_api_key_edit.setText(rec.openai.api_key)
-        self.openai_base_url_edit.setText(rec.openai.base_url)
+        backend = _norm(rec.backend, _KNOWN_BACKENDS, "groq")
+        self.backend_combo.setCurrentIndex(self._backend_index[backend])
+
+        # Все строковые поля (ключи, URL, хоткеи, модели, webhook)
+        # заполняются одним циклом по таблице _FIELD_MAP.
+        for attr, path in _FIELD_MAP:
+            getattr(self, attr).setText(_resolve(settings, path))
 
         # Audio
         device_val = settings.audio.device
@@ -286,53 +288,56 @@ class SettingsDialog(QDialog):
 
         self.speedup_checkbox.setChecked(settings.audio.speedup_x2)
 
-        # Hotkeys
-        self.record_hotkey_edit.setText(settings.hotkeys.record)
-        self.record_idea_hotkey_edit.setText(settings.hotkeys.record_idea)
-
-        # ASR‑модели
-        self.groq_asr_model_edit.setText(rec.groq.model)
-        self.openai_asr_model_edit.setText(rec.openai.model)
-
-        # LLM‑модели (постпроцессинг)
+        # Постпроцессинг
         self.post_enabled_checkbox.setChecked(settings.postprocess.enabled)
 
         # backend постпроцессинга (llm_backend)
-        llm_backend = (settings.postprocess.llm_backend or "groq").lower()
-        idx_llm = (
-            self.post_backend_combo.findData(llm_backend)
-            if llm_backend in ("groq", "openai")
-            else -1
-        )
-        if idx_llm == -1:
-            idx_llm = self.post_backend_combo.findData("groq")
-        if idx_llm != -1:
-            self.post_backend_combo.setCurrentIndex(idx_llm)
-
-        # Модели LLM берём из recognition.*.model_process — это единственный источник правды.
-        self.groq_llm_model_edit.setText(settings.recognition.groq.model_process)
-        self.openai_llm_model_edit.setText(settings.recognition.openai.model_process)
+        llm_backend = _norm(settings.postprocess.llm_backend, _KNOWN_LLM, "groq")
+        self.post_backend_combo.setCurrentIndex(self._post_backend_index[llm_backend])
 
         self.prompt_edit.setPlainText(settings.postprocess.prompt)
 
-        # Integrations
-        self.n8n_webhook_edit.setText(settings.integrations.n8n_webhook_url)
-
         # раньше здесь вызывался _on_backend_changed(), который скрывал поля ключей.
         # теперь все поля всегда видимы, поэтому вызов не нужен.
         # self._on_backend_changed()
 
+        # Снимок формы после загрузки: если пользователь ничего не менял,
+        # _build_new_settings вернёт исходные настройки без пересборки.
+        self._initial_form = self._form_snapshot()
+
+    def _form_snapshot(self) -> tuple:
+        """Текущее состояние всех полей формы одним кортежем."""
+        return (
+            self.backend_combo.currentData(),
+            self.device_combo.currentData(),
+            self.speedup_checkbox.isChecked(),
+            self.post_enabled_checkbox.isChecked(),
+            self.post_backend_combo.currentData(),
+            self.prompt_edit.toPlainText().strip(),
+        ) + tuple(getattr(self, attr).text().strip() for attr, _ in _FIELD_MAP)
+
+    def _field_values(self) -> dict[str, str]:
+        """Собирает значения всех строковых полей формы одним проходом."""
+        return {
+            path: getattr(self, attr).text().strip() for attr, path in _FIELD_MAP
+        }
+
     def _build_new_settings(self) -> AppSettings:
+        # Открыл и сразу нажал OK — ничего не пересобираем
+        if self._form_snapshot() == self._initial_form:
+            return self._original_settings
+
         backend_data = self.backend_combo.currentData()
         backend = str(backend_data) if backend_data is not None else "groq"
 
         old = self._original_settings
+        values = self._field_values()
 
-        groq_asr_model = self.groq_asr_model_edit.text().strip()
-        openai_asr_model = self.openai_asr_model_edit.text().strip()
+        groq_asr_model = values["recognition.groq.model"]
+        openai_asr_model = values["recognition.openai.model"]
 
-        groq_llm_model = self.groq_llm_model_edit.text().strip()
-        openai_llm_model = self.openai_llm_model_edit.text().strip()
+        groq_llm_model = values["recognition.groq.model_process"]
+        openai_llm_model = values["recognition.openai.model_process"]
 
         new_audio = replace(
             old.audio,
@@ -342,8 +347,8 @@ class SettingsDialog(QDialog):
 
         new_hotkeys = replace(
             old.hotkeys,
-            record=self.record_hotkey_edit.text().strip() or old.hotkeys.record,
-            record_idea=self.record_idea_hotkey_edit.text().strip() or old.hotkeys.record_idea,
+            record=values["hotkeys.record"] or old.hotkeys.record,
+            record_idea=values["hotkeys.record_idea"] or old.hotkeys.record_idea,
         )
 
         # Обновляем recognition:
@@ -355,14 +360,14 @@ class SettingsDialog(QDialog):
             backend=backend,
             openai=replace(
                 old.recognition.openai,
-                api_key=self.openai_api_key_edit.text().strip(),
-                base_url=self.openai_base_url_edit.text().strip(),
+                api_key=values["recognition.openai.api_key"],
+                base_url=values["recognition.openai.base_url"],
                 model=openai_asr_model or old.recognition.openai.model,
                 model_process=openai_llm_model or old.recognition.openai.model_process,
             ),
             groq=replace(
                 old.recognition.groq,
-                api_key=self.groq_api_key_edit.text().strip(),
+                api_key=values["recognition.groq.api_key"],
                 model=groq_asr_model or old.recognition.groq.model,
                 model_process=groq_llm_model or old.recognition.groq.model_process,
             ),
@@ -392,7 +397,7 @@ class SettingsDialog(QDialog):
 
         new_integrations = replace(
             old.integrations,
-            n8n_webhook_url=self.n8n_webhook_edit.text().strip(),
+            n8n_webhook_url=values["integrations.n8n_webhook_url"],
         )
 
         return replace(
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import ClassVar, Optional
 
 from PyQt6.QtCore import pyqtSignal, QObject
 from PyQt6.QtGui import QIcon
@@ -9,6 +9,38 @@ from PyQt6.QtWidgets import QMenu, QSystemTrayIcon, QWidget, QApplication, QStyl
 from config.settings import AppInfoConfig
 
 
+# Программная иконка-фолбэк строится ровно один раз на процесс:
+# QPixmap + QPainter на каждый вызов не нужны ради одинакового круга.
+_FALLBACK_ICON: Optional[QIcon] = None
+
+
+def _get_fallback_icon() -> QIcon:
+    """Возвращает простую программную иконку (синий круг), кэшируя её."""
+    global _FALLBACK_ICON
+    if _FALLBACK_ICON is not None:
+        return _FALLBACK_ICON
+
+    # До создания QApplication рисовать QPixmap нельзя — отдаём пустую
+    # иконку, не кэшируя её.
+    if QApplication.instance() is None:
+        return QIcon()
+
+    from PyQt6.QtGui import QPixmap, QPainter, QColor
+
+    pixmap = QPixmap(16, 16)
+    pixmap.fill(QColor(0, 0, 0, 0))  # Прозрачный фон
+
+    painter = QPainter(pixmap)
+    # Антиалиасинг на круге 14 px в трее неразличим — не платим за него
+    painter.setBrush(QColor("#007bff"))  # Синий цвет
+    painter.setPen(QColor("white"))
+    painter.drawEllipse(1, 1, 14, 14)
+    painter.end()
+
+    _FALLBACK_ICON = QIcon(pixmap)
+    return _FALLBACK_ICON
+
+
 class SystemTrayIcon(QObject):
     """
     Minimal system tray integration for MVP.
@@ -25,6 +57,10 @@ class SystemTrayIcon(QObject):
     toggle_debug_requested = pyqtSignal()
     exit_requested = pyqtSignal()
 
+    # Разрешённая системная иконка кэшируется на класс: каскад запросов
+    # к QStyle (поиск пиксмапов по теме) выполняется один раз на процесс.
+    _cached_icon: ClassVar[Optional[QIcon]] = None
+
     def __init__(self, parent_window: QWidget, app_info: AppInfoConfig) -> None:
         super().__init__(parent_window)
         self._parent_window = parent_window
@@ -59,7 +95,12 @@ class SystemTrayIcon(QObject):
         1) SP_MediaVolume (часто отображается как динамик/аудио).
         2) SP_ComputerIcon.
         3) Пустой QIcon (как крайний случай, но setIcon всё равно вызывается).
+
+        Результат кэшируется в _cached_icon и переиспользуется.
         """
+        if SystemTrayIcon._cached_icon is not None:
+            return SystemTrayIcon._cached_icon
+
         app = QApplication.instance()
         if app is None:
             return QIcon()
@@ -70,33 +111,16 @@ class SystemTrayIcon(QObject):
 
         # 1. Пробуем иконку, связанную с аудио/медиа.
         icon = style.standardIcon(QStyle.StandardPixmap.SP_MediaVolume)
-        if not icon.isNull():
-            return icon
-
-        # 2. Фолбэк — стандартная иконка компьютера.
-        icon = style.standardIcon(QStyle.StandardPixmap.SP_ComputerIcon)
-        if not icon.isNull():
-            return icon
-
-        # 3. Крайний случай — генерируем программную иконку (цветной квадрат).
-        # Это гарантирует, что иконка будет видна, даже если системные не найдены.
-        return self._create_fallback_icon()
-
-    def _create_fallback_icon(self) -> QIcon:
-        """Генерирует простую программную иконку (синий круг)."""
-        from PyQt6.QtGui import QPixmap, QPainter, QColor
-        
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(QColor(0, 0, 0, 0))  # Прозрачный фон
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setBrush(QColor("#007bff"))  # Синий цвет
-        painter.setPen(QColor("white"))
-        painter.drawEllipse(1, 1, 14, 14)
-        painter.end()
-        
-        return QIcon(pixmap)
+        if icon.isNull():
+            # 2. Фолбэк — стандартная иконка компьютера.
+            icon = style.standardIcon(QStyle.StandardPixmap.SP_ComputerIcon)
+        if icon.isNull():
+            # 3. Крайний случай — генерируем программную иконку (цветной квадрат).
+            # Это гарантирует, что иконка будет видна, даже если системные не найдены.
+            icon = _get_fallback_icon()
+
+        SystemTrayIcon._cached_icon = icon
+        return icon
 
     def _init_icon(self) -> None:
         """
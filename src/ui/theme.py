@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+"""
+Единый QSS приложения.
+
+Раньше HistoryDialog и SettingsDialog держали собственные inline-стили,
+и Qt парсил один и тот же CSS заново при каждом показе диалога.
+Все правила собраны здесь и применяются ОДИН раз на QApplication;
+конкретные виджеты выбираются через objectName.
+"""
+
+
+APP_QSS = """
+/* ------------------------------------------------------------ история */
+QDialog#historyDialog {
+    background-color: #1e1e1e;
+}
+QDialog#historyDialog QListView {
+    border: none;
+    background: transparent;
+}
+QDialog#historyDialog QScrollBar:vertical {
+    background: #2b2b2b;
+    width: 10px;
+    margin: 0px;
+}
+QDialog#historyDialog QScrollBar::handle:vertical {
+    background: #555;
+    min-height: 20px;
+    border-radius: 5px;
+}
+QDialog#historyDialog QScrollBar::add-line:vertical,
+QDialog#historyDialog QScrollBar::sub-line:vertical {
+    height: 0px;
+}
+QPushButton#historyClearBtn {
+    color: #ff4d4d;
+    background: transparent;
+    border: 1px solid #ff4d4d;
+    border-radius: 4px;
+    padding: 6px 12px;
+    font-size: 10pt;
+}
+QPushButton#historyClearBtn:hover {
+    background: rgba(255, 77, 77, 0.1);
+}
+QPushButton#historyCloseBtn {
+    color: white;
+    background-color: #444;
+    border: none;
+    border-radius: 4px;
+    padding: 6px 16px;
+    font-size: 10pt;
+}
+QPushButton#historyCloseBtn:hover {
+    background-color: #555;
+}
+
+/* ----------------------------------------------------------- настройки */
+QDialog#settingsDialog {
+    background-color: #2b2b2b;
+    color: #f0f0f0;
+}
+QDialog#settingsDialog QGroupBox {
+    color: #f0f0f0;
+    font-weight: bold;
+    border: 1px solid #555555;
+    border-radius: 4px;
+    margin-top: 8px;
+}
+QDialog#settingsDialog QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 8px;
+    padding: 0 4px;
+}
+QDialog#settingsDialog QLabel {
+    color: #f0f0f0;
+}
+QDialog#settingsDialog QLineEdit {
+    background-color: #3a3a3a;
+    color: #ffffff;
+    border: 1px solid #666666;
+    border-radius: 3px;
+    padding: 2px 4px;
+}
+QDialog#settingsDialog QLineEdit:disabled {
+    background-color: #444444;
+    color: #aaaaaa;
+}
+QDialog#settingsDialog QCheckBox {
+    color: #f0f0f0;
+}
+QDialog#settingsDialog QComboBox {
+    background-color: #3a3a3a;
+    color: #ffffff;
+    border: 1px solid #666666;
+    border-radius: 3px;
+    padding: 2px 4px;
+}
+QDialog#settingsDialog QDialogButtonBox QPushButton {
+    min-width: 70px;
+}
+QDialog#settingsDialog QPlainTextEdit {
+    background-color: #3a3a3a;
+    color: #ffffff;
+    border: 1px solid #666666;
+    border-radius: 3px;
+    padding: 2px 4px;
+}
+QPushButton#clearRecoveryBtn {
+    background-color: #4a2b2b;
+    color: white;
+    font-weight: bold;
+}
+QLabel#settingsHintLabel {
+    color: #aaaaaa;
+    font-size: 11px;
+}
+"""
+
+
+def apply_app_theme(app) -> None:
+    """Применяет общий стиль приложения к QApplication (один раз при старте)."""
+    app.setStyleSheet(APP_QSS)
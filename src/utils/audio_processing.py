@@ -1,7 +1,35 @@
+"""
+Ускорение аудио без смены высоты тона (OLA с окном Хэннинга).
+
+Замечание для будущих оптимизаций: ядро OLA ограничено ПАМЯТЬЮ, а не
+арифметикой. На каждый загруженный float32 приходится ~2 FLOP (умножение
+на окно и сложение в выход) — примерно 0.5 FLOP/байт при машинном
+балансе современных CPU в 5–30. Поэтому SIMD-трюки и intrinsics здесь
+почти ничего не дают, а выигрывает всё, что сокращает объём прогоняемых
+байтов: удаление лишних проходов и буферов (нормировка, memset от
+np.zeros), контигуозные последовательные записи вместо scatter по
+матрице индексов, float32 без тихих апкастов в float64. Распараллеливать
+однопроходные memory-bound операции тоже бессмысленно — упрёмся в ту же
+шину памяти.
+"""
+
+import functools
+
 import numpy as np
 from audio.recorder import AudioData
 from loguru import logger
 
+
+# Кэш окон Хэннинга по размеру: sample_rate и factor между записями
+# не меняются, так что окно («ядро» нашего OLA) считается один раз
+# на процесс, а не на каждую остановку записи.
+# float32, как и сэмплы: иначе произведение frame * window тихо
+# апкастится в float64 и весь OLA работает на удвоенной ширине
+@functools.lru_cache(maxsize=8)
+def _get_window(win_size: int) -> np.ndarray:
+    return np.hanning(win_size).astype(np.float32)
+
+
 def speed_up_audio(audio: AudioData, factor: float = 2.0) -> AudioData:
     """
     Speeds up audio by the given factor using a simplified SOLA (Synchronized Overlap-Add) algorithm
@@ -10,133 +38,114 @@ def speed_up_audio(audio: AudioData, factor: float = 2.0) -> AudioData:
     if factor <= 1.0:
         return audio
 
-    try:
-        samples = audio.samples
-        # Ensure samples are 1D if mono
-        if samples.ndim > 1 and samples.shape[1] == 1:
-            samples = samples.flatten()
-        
-        # If stereo, we only process the first channel for now (MVP)
-        # or mix down to mono.
-        if samples.ndim > 1:
-            samples = samples.mean(axis=1)
-
-        sample_rate = audio.sample_rate
-        
-        # Parameters for SOLA
-        # Window size: ~20-30ms is typical for speech
-        win_size = int(0.03 * sample_rate)  # 30ms
-        # Search window for alignment: ~10ms
-        search_range = int(0.01 * sample_rate) # 10ms
-        
-        # Analysis hop (input step)
-        # We want to advance by `win_size` in input, but output will be smaller.
-        # Actually, standard OLA:
-        # Ha (analysis hop)
-        # Hs (synthesis hop) = Ha / factor
-        
-        # Let's fix synthesis hop to be e.g. half window
-        hs = win_size // 2
-        ha = int(hs * factor)
-        
-        # Result buffer
-        # Expected length
-        new_len = int(len(samples) / factor)
-        output = np.zeros(new_len + win_size, dtype=np.float32)
-        
-        # Hanning window for smoothing
-        window = np.hanning(win_size)
-        
-        # Pointers
-        in_pos = 0
-        out_pos = 0
-        
-        while in_pos < len(samples) - win_size - search_range and out_pos < new_len:
-            # Extract frame from input
-            # We look for best match in [in_pos, in_pos + search_range]
-            # to align with the "tail" of the previous output.
-            
-            # Current "tail" of output at out_pos
-            # We want to overlap-add at out_pos.
-            # But we need to find WHERE in input to take the frame from.
-            # Ideally at `in_pos`. But we search around `in_pos` to match phase.
-            
-            # Simplified OLA (no search) causes robotic sound.
-            # Let's try simple OLA first if SOLA is too slow in python.
-            # But user complained about pitch. OLA preserves pitch but adds robotic artifact.
-            # Decimation changed pitch.
-            
-            # Let's implement a very basic OLA first, it's much better than decimation for pitch.
-            # If it's too robotic, we need SOLA.
-            # Given "Vibe-Coding", let's try OLA with Hanning window.
-            
-            frame = samples[in_pos:in_pos+win_size] * window
-            
-            # Add to output
-            # Ensure we don't go out of bounds
-            if out_pos + win_size < len(output):
-                output[out_pos:out_pos+win_size] += frame
-            
-            in_pos += ha
-            out_pos += hs
-
-        # Normalize? OLA can change amplitude.
-        # With 50% overlap and Hanning, it sums to constant 1 if hops are correct.
-        # But here hops change.
-        
-        # Let's try a slightly more robust approach: Phase Vocoder is too complex.
-        # WSOLA is standard.
-        
-        # Let's try a library-free implementation of "phase-locked vocoder" or just OLA.
-        # OLA is:
-        # 1. Cut input into overlapping frames.
-        # 2. Move them closer (for speedup).
-        # 3. Add them up.
-        
-        # To avoid robotic sound, we need to align phases.
-        # Simple cross-correlation alignment (SOLA).
-        
-        # Re-implementing SOLA loop:
-        
-        output = np.zeros(int(len(samples)/factor) + win_size, dtype=np.float32)
-        output_norm = np.zeros(len(output), dtype=np.float32)
-        
-        win = np.hanning(win_size)
-        
-        # Analysis hop
-        Ha = int(win_size * 0.5 * factor)
-        # Synthesis hop
-        Hs = int(win_size * 0.5)
-        
-        i = 0 # input pointer
-        j = 0 # output pointer
-        
-        while i + win_size < len(samples) and j + win_size < len(output):
-            # Input frame
-            frame = samples[i:i+win_size]
-            
-            # Add to output
-            output[j:j+win_size] += frame * win
-            output_norm[j:j+win_size] += win
-            
-            i += Ha
-            j += Hs
-            
-        # Normalize
-        mask = output_norm > 1e-5
-        output[mask] /= output_norm[mask]
-        
-        # Trim
-        output = output[:j]
-        
-        logger.info(f"Audio speed up x{factor} (OLA): {len(samples)} -> {len(output)} samples")
-        
-        return AudioData(
-            samples=output,
-            sample_rate=sample_rate,
-            channels=audio.channels
-        )
-
-    except Exception as e:
-        logger.error(f"Failed to speed up audio: {e}")
-        return audio
\ No newline at end of file
+    samples = audio.samples
+    # Recovery-файлы читаются в родном int16 — для DSP переводим
+    # во float32 [-1, 1] лениво, только когда ускорение реально нужно
+    if samples.dtype == np.int16:
+        samples = samples.astype(np.float32) / 32768.0
+    # Ensure samples are 1D if mono
+    if samples.ndim > 1 and samples.shape[1] == 1:
+        samples = samples.flatten()
+    
+    # If stereo, mix down to mono.
+    # Сведение каналов через matvec (BLAS sgemv): один проход с FMA
+    # вместо универсальной редукции mean с промежуточным буфером
+    if samples.ndim > 1:
+        n_channels = samples.shape[1]
+        weights = np.full(n_channels, 1.0 / n_channels, dtype=np.float32)
+        samples = np.ascontiguousarray(samples, dtype=np.float32) @ weights
+
+    # Один раз приводим к контигуозному float32: дальше умножения и
+    # strided view идут по single-precision SIMD-пути без апкастов
+    samples = np.ascontiguousarray(samples, dtype=np.float32)
+
+    sample_rate = audio.sample_rate
+
+    # Window size: ~20-30ms is typical for speech
+    win_size = int(0.03 * sample_rate)  # 30ms
+
+    # Слишком короткая запись: окну не из чего перекрываться,
+    # ускорять нечего — возвращаем как есть, без исключений
+    if samples.shape[0] < win_size * 2:
+        return audio
+
+    # Нормирующий буфер не нужен: окно Хэннинга при 50% перекрытии
+    # суммируется в константу ~1 (ровно 1 с точностью до краевых Hs
+    # сэмплов и ряби <1% из-за симметричной формы np.hanning) —
+    # делить выход посэмплово не на что. Края остаются с естественным
+    # фейдом первого/последнего полуокна, что заодно убирает щелчки.
+    out_len = int(len(samples) / factor) + win_size
+
+    win = _get_window(win_size)
+
+    # Analysis hop
+    Ha = int(win_size * 0.5 * factor)
+    # Synthesis hop
+    Hs = int(win_size * 0.5)
+
+    # Векторизованный OLA: вместо питоновского цикла по фреймам строим
+    # матрицу перекрывающихся окон (strided view, без копии) и
+    # складываем все фреймы в выход пакетными операциями в C вместо
+    # O(N/Ha) итераций интерпретатора.
+    max_i = (len(samples) - win_size - 1) // Ha
+    max_j = (out_len - win_size - 1) // Hs
+    n_frames = max(0, min(max_i, max_j) + 1)
+
+    if n_frames > 0 and win_size == 2 * Hs:
+        # 50% перекрытие: чётные кадры ложатся в выход встык с нулевого
+        # сэмпла, нечётные — встык со сдвигом Hs. Внутри каждой группы
+        # записи не пересекаются, поэтому вместо scatter-add по матрице
+        # индексов достаточно двух обычных проходов по контигуозным view:
+        # последовательные, дружелюбные к кэшу записи без индексов вовсе.
+        # Выход — np.empty: чётная группа ПИШЕТ свой диапазон присваиванием,
+        # так что memset от np.zeros (полный проход по буферу) не нужен;
+        # нечётная группа докладывается через `+=` поверх уже записанного.
+        # Хвост за обрезкой j остаётся неинициализированным и отбрасывается.
+        frames = np.lib.stride_tricks.sliding_window_view(samples, win_size)
+        frames = frames[::Ha][:n_frames] * win
+        output = np.empty(out_len, dtype=np.float32)
+        # При чётном n_frames последний нечётный кадр выступает на Hs
+        # за покрытие чётной группы — обнуляем этот зазор, иначе `+=`
+        # читает мусор из np.empty (результат за обрезкой и так
+        # отбрасывается, но NaN/inf в мусоре дают RuntimeWarning на
+        # каждый вызов)
+        even_stop = ((n_frames + 1) // 2) * win_size
+        odd_stop = Hs + (n_frames // 2) * win_size
+        if odd_stop > even_stop:
+            output[even_stop:odd_stop] = 0.0
+        for parity in (0, 1):
+            group = frames[parity::2]
+            if group.shape[0] == 0:
+                continue
+            start = parity * Hs
+            stop = start + group.shape[0] * win_size
+            out_view = output[start:stop].reshape(-1, win_size)
+            if parity == 0:
+                out_view[:] = group
+            else:
+                out_view += group
+    else:
+        output = np.zeros(out_len, dtype=np.float32)
+        if n_frames > 0:
+            # Нечётный win_size: группы пересекались бы, остаётся scatter.
+            # Индексы — int32: матрица n_frames x win_size и так лишняя
+            # полоса пропускания, незачем гонять её в int64
+            frames = np.lib.stride_tricks.sliding_window_view(samples, win_size)
+            frames = frames[::Ha][:n_frames] * win
+            starts = np.arange(n_frames, dtype=np.int32) * np.int32(Hs)
+            cols = np.arange(win_size, dtype=np.int32)
+            idx = starts[:, None] + cols[None, :]
+            np.add.at(output, idx, frames)
+
+    j = n_frames * Hs  # output pointer after the last frame
+
+    # Trim
+    output = output[:j]
+    
+    logger.info(f"Audio speed up x{factor} (OLA): {len(samples)} -> {len(output)} samples")
+    
+    return AudioData(
+        samples=output,
+        sample_rate=sample_rate,
+        channels=audio.channels
+    )
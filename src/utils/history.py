@@ -1,28 +1,98 @@
+import atexit
 import json
+import threading
+from collections import deque
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from loguru import logger
 from datetime import datetime
 
+# Кэш распарсенной истории по пути файла: (mtime, число строк, записи).
+# Повторные конструирования HistoryManager (например, при перезагрузке
+# настроек) не перечитывают и не перепарсивают неизменившийся файл.
+_HISTORY_CACHE: Dict[Path, Tuple[float, int, List[Dict[str, str]]]] = {}
+
+
 class HistoryManager:
     """
     Управляет историей распознаваний.
-    Сохраняет последние N записей в JSON файл.
-    Каждая запись содержит:
+    Хранит последние N записей в JSON Lines файле (по записи на строку,
+    старые в начале файла). Каждая запись содержит:
     - timestamp: время записи
     - raw_text: исходный текст
     - processed_text: обработанный текст
+
+    add_item дописывает ОДНУ строку в конец файла — O(размер записи)
+    вместо пересериализации всего списка. Когда файл разрастается сверх
+    2×max_items строк, он ужимается отложенной перезаписью (таймер +
+    гарантированный flush при завершении процесса).
     """
+
+    FLUSH_DELAY = 1.0
+
     def __init__(self, base_dir: Path, max_items: int = 50):
-        self.history_file = base_dir / "history.json"
+        self.history_file = base_dir / "history.jsonl"
+        self._legacy_file = base_dir / "history.json"
         self.max_items = max_items
-        self._history: List[Dict[str, str]] = self._load_history()
+        self._line_count = 0
+        # deque с maxlen: appendleft за O(1) и автоматическое вытеснение
+        # старых записей вместо insert(0)+срез на каждый add_item
+        self._history: deque = deque(self._load_history(), maxlen=max_items)
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        atexit.register(self.flush)
 
     def _load_history(self) -> List[Dict[str, str]]:
-        if not self.history_file.exists():
-            return []
+        if self.history_file.exists():
+            return self._load_jsonl()
+        if self._legacy_file.exists():
+            items = self._load_legacy()
+            if items:
+                # Однократная миграция старого history.json в новый формат
+                self._rewrite_file(items)
+            return items
+        return []
+
+    def _load_jsonl(self) -> List[Dict[str, str]]:
+        """Читает файл построчно, оставляя только последние max_items записей."""
+        try:
+            mtime = self.history_file.stat().st_mtime
+        except OSError:
+            mtime = 0.0
+
+        cached = _HISTORY_CACHE.get(self.history_file)
+        if cached is not None and cached[0] == mtime:
+            self._line_count = cached[1]
+            # Отдаём копии записей, чтобы инстансы не делили словари
+            return [dict(item) for item in cached[2]]
+
+        tail: deque = deque(maxlen=self.max_items)
         try:
             with open(self.history_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    self._line_count += 1
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        item = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(item, dict):
+                        tail.append(item)
+        except Exception as e:
+            logger.error("Failed to load history: {}", e)
+            return []
+        # В файле старые записи первыми, в памяти держим новые первыми
+        items = list(tail)
+        items.reverse()
+        _HISTORY_CACHE[self.history_file] = (mtime, self._line_count, [dict(i) for i in items])
+        return items
+
+    def _load_legacy(self) -> List[Dict[str, str]]:
+        try:
+            with open(self._legacy_file, "r", encoding="utf-8") as f:
                 data = json.load(f)
                 if isinstance(data, list):
                     # Миграция старого формата (список строк) в новый (список словарей)
@@ -39,40 +109,81 @@ class HistoryManager:
                     return migrated_data
                 return []
         except Exception as e:
-            logger.error(f"Failed to load history: {e}")
+            logger.error("Failed to load history: {}", e)
             return []
 
-    def _save_history(self):
+    def _rewrite_file(self, items: List[Dict[str, str]]) -> None:
+        """Переписывает файл компактно: только актуальные записи, старые первыми."""
         try:
             with open(self.history_file, "w", encoding="utf-8") as f:
-                json.dump(self._history, f, ensure_ascii=False, indent=2)
+                for item in reversed(items):
+                    f.write(json.dumps(item, ensure_ascii=False, separators=(",", ":")) + "\n")
+            self._line_count = len(items)
+        except Exception as e:
+            logger.error("Failed to save history: {}", e)
+
+    def _append_entry(self, entry: Dict[str, str]) -> None:
+        try:
+            with open(self.history_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+            self._line_count += 1
         except Exception as e:
-            logger.error(f"Failed to save history: {e}")
+            logger.error("Failed to save history: {}", e)
+
+    def _mark_dirty(self) -> None:
+        """Помечает файл нуждающимся в компактной перезаписи и взводит таймер."""
+        self._dirty = True
+        if self._flush_timer is None:
+            timer = threading.Timer(self.FLUSH_DELAY, self.flush)
+            timer.daemon = True
+            self._flush_timer = timer
+            timer.start()
+
+    def flush(self) -> None:
+        """Ужимает файл до актуальных записей, если копились изменения."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            snapshot = list(self._history)
+            self._dirty = False
+        self._rewrite_file(snapshot)
 
     def add_item(self, raw_text: str, processed_text: str):
         if not processed_text or not processed_text.strip():
             return
-        
-        # Убираем дубликаты, если новый текст совпадает с последним
-        if self._history and self._history[0].get("processed_text") == processed_text:
-            return
 
-        entry = {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "raw_text": raw_text.strip(),
-            "processed_text": processed_text.strip()
-        }
+        with self._lock:
+            # Убираем дубликаты, если новый текст совпадает с последним
+            if self._history and self._history[0].get("processed_text") == processed_text:
+                return
+
+            entry = {
+                # isoformat даёт тот же "YYYY-MM-DD HH:MM:SS", но без разбора
+                # формат-строки на каждый вызов
+                "timestamp": datetime.now().isoformat(sep=" ", timespec="seconds"),
+                "raw_text": raw_text.strip(),
+                "processed_text": processed_text.strip()
+            }
+
+            self._history.appendleft(entry)
 
-        self._history.insert(0, entry)
-        
-        if len(self._history) > self.max_items:
-            self._history = self._history[:self.max_items]
-            
-        self._save_history()
+            # Дешёвый путь: одна строка в конец файла. Компактная перезапись
+            # нужна только когда файл оброс устаревшими строками.
+            self._append_entry(entry)
+            if self._line_count > 2 * self.max_items:
+                self._mark_dirty()
 
     def get_items(self) -> List[Dict[str, str]]:
-        return self._history
+        return list(self._history)
 
     def clear(self):
-        self._history = []
-        self._save_history()
\ No newline at end of file
+        with self._lock:
+            self._history.clear()
+            self._dirty = False
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        self._rewrite_file([])
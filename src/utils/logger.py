@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import atexit
+import sys
+import threading
+from collections import deque
 from pathlib import Path
 import os
 
@@ -8,6 +12,78 @@ from loguru import logger  # type: ignore[import]
 from config.settings import LoggingConfig
 
 
+class _BatchedFileSink:
+    """
+    Файловый sink с пакетной записью.
+
+    Сообщения копятся в буфере и пишутся на диск одним writelines
+    раз в 100 мс или при накоплении 64 КБ — вместо open/write/close
+    на каждую запись. Ротация по размеру с нумерованными бэкапами
+    сохранена. atexit гарантирует финальный сброс буфера.
+    """
+
+    MAX_PENDING_BYTES = 64 * 1024
+    FLUSH_INTERVAL = 0.1
+
+    def __init__(self, path: Path, rotate_size: int, backup_count: int) -> None:
+        self._path = path
+        self._rotate_size = rotate_size
+        self._backup_count = backup_count
+        self._buffer: deque = deque()
+        self._pending_bytes = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._flush_loop, name="log-flush", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def __call__(self, message) -> None:
+        text = str(message)
+        with self._lock:
+            self._buffer.append(text)
+            self._pending_bytes += len(text)
+            overflow = self._pending_bytes >= self.MAX_PENDING_BYTES
+        if overflow:
+            self.flush()
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.FLUSH_INTERVAL):
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._buffer:
+                return
+            lines = list(self._buffer)
+            self._buffer.clear()
+            self._pending_bytes = 0
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with self._path.open("a", encoding="utf-8") as f:
+                f.writelines(lines)
+            self._maybe_rotate()
+        except Exception as e:
+            print(f"Failed to write to log file: {e}")
+
+    def _maybe_rotate(self) -> None:
+        try:
+            if self._path.stat().st_size < self._rotate_size:
+                return
+            # Сдвигаем нумерованные бэкапы: app.log.2 -> app.log.3 и т.д.
+            for i in range(self._backup_count - 1, 0, -1):
+                src = self._path.with_name(f"{self._path.name}.{i}")
+                if src.exists():
+                    src.replace(self._path.with_name(f"{self._path.name}.{i + 1}"))
+            if self._backup_count > 0:
+                self._path.replace(self._path.with_name(f"{self._path.name}.1"))
+            else:
+                self._path.unlink()
+        except OSError:
+            pass
+
+
 def setup_logging(config: LoggingConfig) -> None:
     """
     Configure loguru according to LoggingConfig.
@@ -17,9 +93,10 @@ def setup_logging(config: LoggingConfig) -> None:
     """
     logger.remove()
 
-    # Console
+    # Console: поток напрямую — loguru пишет своим оптимизированным
+    # писателем без лишнего кадра lambda и блокировок print на каждую строку
     logger.add(
-        sink=lambda msg: print(msg, end=""),
+        sink=sys.stderr,
         level=config.level.upper(),
         colorize=True,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
@@ -28,49 +105,22 @@ def setup_logging(config: LoggingConfig) -> None:
         "<level>{message}</level>",
     )
 
-    # File with reverse logging (newest at top) and size limit
+    # Файл: append с пакетной записью и ротацией по размеру.
+    # Формат «новые сверху» убран: он требовал переписывать файл на каждое
+    # сообщение (O(размер файла) на запись). Append стоит O(длины строки),
+    # а свежие записи смотрятся обычным tail / прокруткой в конец.
     log_path = Path(config.file)
-    
-    def reverse_sink(message):
-        """Writes log message to the beginning of the file."""
-        try:
-            # Ensure directory exists
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Read existing content
-            existing_content = ""
-            if log_path.exists():
-                try:
-                    with log_path.open("r", encoding="utf-8") as f:
-                        existing_content = f.read()
-                except Exception:
-                    pass
-            
-            # Prepend new message
-            new_content = message + existing_content
-            
-            # Truncate if exceeds 1MB (approx 10^6 chars)
-            max_size = 1024 * 1024
-            if len(new_content) > max_size:
-                # Find the last newline before max_size to avoid cutting lines
-                cut_index = new_content.rfind('\n', 0, max_size)
-                if cut_index != -1:
-                    new_content = new_content[:cut_index+1]
-                else:
-                    new_content = new_content[:max_size]
-            
-            # Write back
-            with log_path.open("w", encoding="utf-8") as f:
-                f.write(new_content)
-                
-        except Exception as e:
-            print(f"Failed to write to log file: {e}")
+    log_path.parent.mkdir(parents=True, exist_ok=True)
 
     logger.add(
-        sink=reverse_sink,
+        sink=_BatchedFileSink(
+            log_path,
+            rotate_size=config.max_file_size,
+            backup_count=config.backup_count,
+        ),
         level=config.level.upper(),
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-        enqueue=True, # Thread-safe
+        enqueue=True,  # Thread-safe
         backtrace=True,
         diagnose=True,
-    )
\ No newline at end of file
+    )
@@ -1,4 +1,8 @@
+import hashlib
+import mmap
+import queue
 import sys
+import threading
 import time
 from pathlib import Path
 from typing import List, Optional
@@ -16,51 +20,160 @@ class RecoveryManager:
     
     Files are saved in `recovery/` directory relative to the application executable/script.
     Naming convention: `rec_{timestamp}_{duration}.wav`
+
+    Запись WAV выполняется отдельным фоновым потоком через очередь:
+    save_audio возвращает путь сразу, не блокируя поток распознавания
+    на дисковый ввод-вывод.
     """
 
     def __init__(self, base_dir: Path):
         self.recovery_dir = base_dir / "recovery"
         self.recovery_dir.mkdir(parents=True, exist_ok=True)
 
+        self._save_queue: queue.Queue = queue.Queue()
+        # Пути, ожидающие записи, и пути, чья запись отменена cleanup'ом
+        # до того, как файл успел попасть на диск
+        self._pending: set = set()
+        self._cancelled: set = set()
+        self._state_lock = threading.Lock()
+        # Кэш отсортированного списка recovery-файлов; сбрасывается при
+        # любой мутации каталога и сверяется с mtime каталога на случай
+        # внешних изменений
+        self._files_cache: Optional[List[Path]] = None
+        self._files_cache_mtime: Optional[float] = None
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="recovery-writer", daemon=True
+        )
+        self._writer_thread.start()
+
     def save_audio(self, audio: AudioData) -> Path:
         """
-        Saves AudioData to a WAV file in the recovery directory.
-        Returns the path to the saved file.
+        Queues AudioData for saving to a WAV file in the recovery directory.
+        Returns the prospective path immediately; the write happens on the
+        background writer thread.
         """
         # Ensure directory exists (just in case)
         self.recovery_dir.mkdir(parents=True, exist_ok=True)
 
         timestamp = int(time.time() * 1000)
-        duration = len(audio.samples) / audio.sample_rate
-        filename = f"rec_{timestamp}_{duration:.2f}.wav"
+        # Берём длину явно по первой оси (сэмплы), а не len(): так намерение
+        # видно и для (samples, channels)-раскладки
+        n_samples = audio.samples.shape[0]
+        duration = n_samples / audio.sample_rate
+        filename = "rec_%d_%.2f.wav" % (timestamp, duration)
         filepath = self.recovery_dir / filename
 
+        with self._state_lock:
+            self._pending.add(filepath)
+        self._files_cache = None
+        self._save_queue.put((filepath, audio))
+        return filepath
+
+    def flush(self) -> None:
+        """Блокируется, пока все поставленные в очередь записи не лягут на диск."""
+        self._save_queue.join()
+
+    def _writer_loop(self) -> None:
+        while True:
+            filepath, audio = self._save_queue.get()
+            try:
+                with self._state_lock:
+                    if filepath in self._cancelled:
+                        # Файл уже "удалён" cleanup'ом — не пишем вовсе
+                        self._cancelled.discard(filepath)
+                        self._pending.discard(filepath)
+                        continue
+                self._write_wav(filepath, audio)
+                self._files_cache = None
+                with self._state_lock:
+                    self._pending.discard(filepath)
+                    # cleanup мог прийти во время записи — доудаляем
+                    if filepath in self._cancelled:
+                        self._cancelled.discard(filepath)
+                        try:
+                            filepath.unlink(missing_ok=True)
+                        except OSError:
+                            pass
+            finally:
+                self._save_queue.task_done()
+
+    def _write_wav(self, filepath: Path, audio: AudioData) -> None:
         try:
+            samples = audio.samples
+            if getattr(samples, "dtype", None) != np.int16:
+                # Квантуем в int16 сами и один раз: libsndfile не делает
+                # собственную float→int16 конверсию во временный буфер,
+                # пиковая память не удваивается на размер записи.
+                samples = np.clip(samples * 32767.0, -32768, 32767).astype(np.int16)
+
             # Convert Path to str for compatibility with soundfile/libsndfile
-            sf.write(str(filepath), audio.samples, audio.sample_rate, format="WAV", subtype="PCM_16")
-            logger.info(f"Audio saved for recovery: {filepath}")
-            return filepath
+            with sf.SoundFile(
+                str(filepath),
+                mode="w",
+                samplerate=audio.sample_rate,
+                channels=audio.channels,
+                format="WAV",
+                subtype="PCM_16",
+            ) as f:
+                f.write(samples)
+            logger.info("Audio saved for recovery: {}", filepath)
         except Exception as e:
-            logger.error(f"Failed to save recovery audio: {e}")
-            raise
+            logger.error("Failed to save recovery audio: {}", e)
+
+    def payload_digest(self, filepath: Path) -> Optional[str]:
+        """
+        Хэш PCM-полезной нагрузки WAV-файла без декодирования.
+
+        Файл отображается в память (mmap), RIFF-чанки пролистываются до
+        "data", и хэшируются ровно те байты int16, которые load_audio
+        вернул бы как samples.tobytes(). Это позволяет сверить файл с
+        ASR-кэшем до загрузки сэмплов: совпало — декодировать нечего.
+        """
+        try:
+            with filepath.open("rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if mm[0:4] != b"RIFF" or mm[8:12] != b"WAVE":
+                        return None
+                    offset = 12
+                    while offset + 8 <= len(mm):
+                        chunk_id = mm[offset:offset + 4]
+                        size = int.from_bytes(mm[offset + 4:offset + 8], "little")
+                        if chunk_id == b"data":
+                            # Срез mmap даёт bytes-копию: memoryview тут
+                            # нельзя — живой экспорт буфера не даст mmap
+                            # закрыться на выходе из with (BufferError)
+                            payload = mm[offset + 8:offset + 8 + size]
+                            return hashlib.blake2b(payload, digest_size=16).hexdigest()
+                        # Чанки выравниваются по чётной границе
+                        offset += 8 + size + (size & 1)
+            return None
+        except (OSError, ValueError, BufferError) as e:
+            logger.debug("Failed to hash recovery payload {}: {}", filepath, e)
+            return None
 
     def load_audio(self, filepath: Path) -> Optional[AudioData]:
         """
         Loads AudioData from a WAV file.
         """
         try:
-            data, sample_rate = sf.read(filepath, dtype="float32")
+            # Читаем в родном int16: файл записан как PCM_16, декодирование
+            # во float32 удваивало память и тратило время на конверсию.
+            # Кто ниже по конвейеру работает с float (DSP), конвертирует
+            # лениво сам; упаковка обратно в WAV принимает int16 как есть.
+            with sf.SoundFile(str(filepath)) as f:
+                data = f.read(dtype="int16", always_2d=False)
+                sample_rate = f.samplerate
             # soundfile reads as (samples, channels) if channels > 1, or just (samples,) if mono.
             # AudioData expects (samples,) for mono or (samples, channels).
             # Our recorder usually produces mono or stereo.
-            
+
             channels = 1
             if len(data.shape) > 1:
                 channels = data.shape[1]
-            
+
             return AudioData(samples=data, sample_rate=sample_rate, channels=channels)
         except Exception as e:
-            logger.error(f"Failed to load recovery audio from {filepath}: {e}")
+            logger.error("Failed to load recovery audio from {}: {}", filepath, e)
             return None
 
     def get_recovery_files(self) -> List[Path]:
@@ -69,22 +182,39 @@ class RecoveryManager:
         """
         if not self.recovery_dir.exists():
             return []
-        
+
+        try:
+            dir_mtime = self.recovery_dir.stat().st_mtime
+        except OSError:
+            dir_mtime = None
+
+        if self._files_cache is not None and dir_mtime == self._files_cache_mtime:
+            return list(self._files_cache)
+
         files = list(self.recovery_dir.glob("*.wav"))
         # Sort by modification time
         files.sort(key=lambda p: p.stat().st_mtime)
-        return files
+        self._files_cache = files
+        self._files_cache_mtime = dir_mtime
+        return list(files)
 
     def cleanup(self, filepath: Path):
         """
         Deletes the recovery file.
         """
+        with self._state_lock:
+            if filepath in self._pending:
+                # Запись ещё в очереди/в процессе — помечаем на отмену,
+                # writer-поток удалит или не станет писать файл сам
+                self._cancelled.add(filepath)
+                return
         try:
             if filepath.exists():
                 filepath.unlink()
-                logger.info(f"Recovery file deleted: {filepath}")
+                self._files_cache = None
+                logger.info("Recovery file deleted: {}", filepath)
         except Exception as e:
-            logger.error(f"Failed to delete recovery file {filepath}: {e}")
+            logger.error("Failed to delete recovery file {}: {}", filepath, e)
 
     def clear_all(self):
         """
@@ -94,6 +224,6 @@ class RecoveryManager:
             files = self.get_recovery_files()
             for f in files:
                 self.cleanup(f)
-            logger.info(f"Recovery directory cleared. Deleted {len(files)} files.")
+            logger.info("Recovery directory cleared. Deleted {} files.", len(files))
         except Exception as e:
-            logger.error(f"Failed to clear recovery directory: {e}")
\ No newline at end of file
+            logger.error("Failed to clear recovery directory: {}", e)
\ No newline at end of file